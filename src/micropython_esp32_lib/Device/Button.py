@@ -2,45 +2,89 @@
 # file: ./Device/Button.py
 """
 
-import machine
 import asyncio
+import utime
 import abc
 
 try:
-  from ..System import Timer
   from ..System import Sleep
   from ..System import Digital
-  from ..Utils import Enum
-  from ..Utils import Flag
   from ..Utils import Logging
   from ..Utils import DigitalFilters
   from ..Utils import ListenerHandler
 except ImportError:
-  from micropython_esp32_lib.System import Timer
   from micropython_esp32_lib.System import Sleep
   from micropython_esp32_lib.System import Digital
-  from micropython_esp32_lib.Utils import Enum
-  from micropython_esp32_lib.Utils import Flag
   from micropython_esp32_lib.Utils import Logging
   from micropython_esp32_lib.Utils import DigitalFilters
   from micropython_esp32_lib.Utils import ListenerHandler
 
-class State(Enum.Unit):
-  def __eq__(self, other) -> bool:
-    if isinstance(other, State): return self.value == other.value
-    return False
+try: _wait_for_ms = asyncio.wait_for_ms # type: ignore
+except AttributeError: _wait_for_ms = lambda aw, timeout_ms: asyncio.wait_for(aw, timeout_ms/1000.0)
+
+class State(int):
+  """Button state; an `int` subclass so it compares equal to its plain value.
+
+  The `STATE` members are singletons, so the buttons compare their own states by identity (`is`), a single pointer compare.
+  """
+  def __new__(cls, name: str, value: int):
+    inst = super().__new__(cls, value)
+    inst.name = name
+    return inst
+  @property
+  def value(self) -> int:
+    return int(self)
+  def __str__(self) -> str:
+    return self.name
+  def __repr__(self) -> str:
+    return f"State({self.name}, {int(self)})"
 class STATE:
   BOUNCING = State("BOUNCING", 0)
   RELEASED = State("RELEASED", 1)
   PRESSED = State("PRESSED", 2)
 
 class BaseButton(abc.ABC):
-  def __init__(self, pin: machine.Pin, released_signal: Digital.Signal, interval_ms: int = 16, log_name: str = "Button", log_level: Logging.Level = Logging.LEVEL.INFO):
-    self.pin: machine.Pin = pin
+  _tracksPressTime: bool = False
+  def __init__(self, pin: "machine.Pin", released_signal: "Digital.Signal | int", interval_ms: int = 16, log_name: str = "Button", log_level: Logging.Level = Logging.LEVEL.INFO):
+    if not isinstance(released_signal, Digital.Signal):
+      released_signal = Digital.SIGNAL.HIGH if released_signal else Digital.SIGNAL.LOW
+    self.pin: "machine.Pin" = pin
+    self._pin_value = pin.value
     self.released_signal: Digital.Signal = released_signal
     self.pressed_signal: Digital.Signal = Digital.SIGNAL.inverse(released_signal)
+    self._released_v: int = released_signal.value
+    self._pressed_v: int = self.pressed_signal.value
     self.interval_ms: int = interval_ms
     self.logger: Logging.Log = Logging.Log(log_name, log_level)
+    self._dbg: bool = self.logger.isEnabledFor(Logging.LEVEL.DEBUG)
+    self._pressed_at_ms: int = 0 # ticks_ms of the last debounced press, kept by buttons with `_tracksPressTime`
+  def _attachEdgeFlag(self):
+    """Attaches an IRQ on both edges of the pin and returns the flag it sets.
+
+    With `asyncio.ThreadSafeFlag` the handler is a hard IRQ, waking the waiting task without a detour through the soft-IRQ queue.
+    Ports without it get an `asyncio.Event`, which is not ISR-safe, so its `set()` is deferred with `micropython.schedule`.
+    """
+    trigger = Digital.IRQCode.IRQ_RISING | Digital.IRQCode.IRQ_FALLING
+    try:
+      flag = asyncio.ThreadSafeFlag() # type: ignore
+    except AttributeError:
+      flag = asyncio.Event()
+      try:
+        from micropython import schedule
+      except ImportError:
+        self.pin.irq(trigger=trigger, handler=lambda pin: flag.set())
+        return flag
+      set_later = lambda _: flag.set()
+      def handler(pin):
+        try: schedule(set_later, None)
+        except RuntimeError: pass # schedule queue full; an earlier pending set() covers this edge
+      self.pin.irq(trigger=trigger, handler=handler)
+      return flag
+    set_flag = flag.set # bound once: a hard IRQ must not allocate
+    handler = lambda pin: set_flag()
+    try: self.pin.irq(trigger=trigger, handler=handler, hard=True)
+    except TypeError: self.pin.irq(trigger=trigger, handler=handler)
+    return flag
   @abc.abstractmethod
   async def getState(self) -> State:
     pass
@@ -59,20 +103,20 @@ class BaseButton(abc.ABC):
 
 
 class ImmediateDebounceButton(BaseButton):
-  def __init__(self, pin: machine.Pin, released_signal: Digital.Signal, interval_ms: int = 16, log_name: str = "ImmediateDebounceButton", log_level: Logging.Level = Logging.LEVEL.INFO):
+  def __init__(self, pin: "machine.Pin", released_signal: Digital.Signal, interval_ms: int = 16, log_name: str = "ImmediateDebounceButton", log_level: Logging.Level = Logging.LEVEL.INFO):
     super().__init__(pin, released_signal, interval_ms, log_name, log_level)
   async def getState(self) -> State:
     await Sleep.async_ms(1)
-    pinValue: int = self.pin.value()
-    if pinValue == self.released_signal: return STATE.RELEASED
-    elif pinValue == self.pressed_signal: return STATE.PRESSED
+    pinValue: int = self._pin_value()
+    if pinValue == self._released_v: return STATE.RELEASED
+    elif pinValue == self._pressed_v: return STATE.PRESSED
     return STATE.BOUNCING
   async def isReleased(self) -> bool:
     await Sleep.async_ms(1)
-    return self.pin.value() == self.released_signal
+    return self._pin_value() == self._released_v
   async def isPressed(self) -> bool:
     await Sleep.async_ms(1)
-    return self.pin.value() == self.pressed_signal
+    return self._pin_value() == self._pressed_v
   async def isToReleased(self) -> bool:
     if await self.isPressed():
       await Sleep.async_ms(self.interval_ms)
@@ -85,18 +129,33 @@ class ImmediateDebounceButton(BaseButton):
     return False
 
 class CountFilteringImmediateDebounceButton(ImmediateDebounceButton):
-  def __init__(self, pin: machine.Pin, released_signal: Digital.Signal, interval_ms: int = 1, threshold: int = 16, log_name: str = "CountFilteringImmediateDebounceButton", log_level: Logging.Level = Logging.LEVEL.INFO):
+  def __init__(self, pin: "machine.Pin", released_signal: Digital.Signal, interval_ms: int = 1, threshold: int = 16, log_name: str = "CountFilteringImmediateDebounceButton", log_level: Logging.Level = Logging.LEVEL.INFO):
     super().__init__(pin, released_signal, interval_ms, log_name, log_level)
     self.threshold: int = threshold
+    self._bindPredicates()
+  def _bindPredicates(self) -> None:
+    """Shadows the filter-backed predicates with closures over their fixed arguments, saving a method frame and five attribute loads per poll.
+
+    The arguments are captured here, so call it again after changing `threshold` or `interval_ms`. Predicates overridden by a subclass are left alone.
+    """
+    cls = CountFilteringImmediateDebounceButton
+    kind = type(self)
+    countFiltering, isChangedStably = DigitalFilters.countFiltering_async, DigitalFilters.isChangedStably_async
+    pin, released, pressed, threshold, interval_ms = self.pin, self.released_signal, self.pressed_signal, self.threshold, self.interval_ms
+    if kind.isReleased is cls.isReleased: self.isReleased = lambda: countFiltering(pin, released, threshold, interval_ms)
+    if kind.isPressed is cls.isPressed: self.isPressed = lambda: countFiltering(pin, pressed, threshold, interval_ms)
+    if kind.isToReleased is cls.isToReleased: self.isToReleased = lambda: isChangedStably(pin, pressed, released, threshold, interval_ms)
+    if kind.isToPressed is cls.isToPressed: self.isToPressed = lambda: isChangedStably(pin, released, pressed, threshold, interval_ms)
   async def getState(self):
+    read, sleep, threshold, interval_ms = self._pin_value, Sleep.async_ms, self.threshold, self.interval_ms
     cnt: int = 0
-    for _ in range(self.threshold):
-      cnt += self.pin.value()
-      await Sleep.async_ms(self.interval_ms)
-    if cnt == self.threshold: 
-      return STATE.RELEASED if self.released_signal.value == 1 else STATE.PRESSED
+    for _ in range(threshold):
+      cnt += read()
+      await sleep(interval_ms)
+    if cnt == threshold: 
+      return STATE.RELEASED if self._released_v == 1 else STATE.PRESSED
     elif cnt == 0: 
-      return STATE.PRESSED if self.pressed_signal.value == 0 else STATE.RELEASED
+      return STATE.PRESSED if self._pressed_v == 0 else STATE.RELEASED
     return STATE.BOUNCING
   async def isReleased(self) -> bool:
     return await DigitalFilters.countFiltering_async(self.pin, self.released_signal, self.threshold, self.interval_ms)
@@ -107,131 +166,406 @@ class CountFilteringImmediateDebounceButton(ImmediateDebounceButton):
   async def isToPressed(self) -> bool:
     return await DigitalFilters.isChangedStably_async(self.pin, self.released_signal, self.pressed_signal, self.threshold, self.interval_ms)
 
+class InterruptDrivenCountFilteringButton(CountFilteringImmediateDebounceButton):
+  """Count-filtering button that only samples the pin after an edge IRQ.
+
+  The count filter runs for one debounce window per edge instead of polling the pin continuously, so an idle button costs no CPU.
+  Call `activate()` before listening.
+  """
+  _tracksPressTime: bool = True
+  def __init__(self, pin: "machine.Pin", released_signal: Digital.Signal, interval_ms: int = 1, threshold: int = 16, log_name: str = "InterruptDrivenCountFilteringButton", log_level: Logging.Level = Logging.LEVEL.INFO):
+    super().__init__(pin, released_signal, interval_ms, threshold, log_name, log_level)
+    self._current_state: State = STATE.BOUNCING
+    self._toPressed_event: asyncio.Event = asyncio.Event()
+    self._toReleased_event: asyncio.Event = asyncio.Event()
+    self.active: bool = False
+    self._filter_task: asyncio.Task | None = None
+    self._edge = self._attachEdgeFlag()
+  async def _filter_loop(self):
+    countFiltering, edge = DigitalFilters.countFiltering_async, self._edge
+    while self.active:
+      await edge.wait()
+      edge.clear()
+      if await countFiltering(self.pin, self.pressed_signal, self.threshold, self.interval_ms):
+        if self._current_state is not STATE.PRESSED:
+          self._current_state = STATE.PRESSED
+          self._pressed_at_ms = utime.ticks_ms()
+          self._toPressed_event.set()
+      elif self._current_state is not STATE.RELEASED:
+        self._current_state = STATE.RELEASED
+        self._toReleased_event.set()
+  async def activate(self):
+    self.active = True
+    if self._filter_task is None or self._filter_task.done():
+      self._filter_task = asyncio.create_task(self._filter_loop())
+  def deactivate(self):
+    self.active = False
+    if self._filter_task is not None:
+      self._filter_task.cancel()
+    self._filter_task = None
+  async def getState(self) -> State:
+    return self._current_state
+  async def isReleased(self) -> bool:
+    return self._current_state is STATE.RELEASED
+  async def isPressed(self) -> bool:
+    return self._current_state is STATE.PRESSED
+  def consumeToReleased(self) -> bool:
+    if self._toReleased_event.is_set():
+      self._toReleased_event.clear()
+      return True
+    return False
+  def consumeToPressed(self) -> bool:
+    if self._toPressed_event.is_set():
+      self._toPressed_event.clear()
+      return True
+    return False
+  async def isToReleased(self) -> bool:
+    return self.consumeToReleased()
+  async def isToPressed(self) -> bool:
+    return self.consumeToPressed()
+
 class StateDebounceButton(BaseButton):
-  def __init__(self, pin: machine.Pin, released_signal: Digital.Signal, interval_ms: int = 16, log_name: str = "StateDebounceButton", log_level: Logging.Level = Logging.LEVEL.INFO):
+  def __init__(self, pin: "machine.Pin", released_signal: Digital.Signal, interval_ms: int = 16, log_name: str = "StateDebounceButton", log_level: Logging.Level = Logging.LEVEL.INFO):
     super().__init__(pin, released_signal, interval_ms, log_name, log_level)
     self._last_state: State = STATE.BOUNCING
   async def getState(self):
     # await Sleep.async_ms(1)
-    pinValue: int = self.pin.value()
-    if pinValue == self.released_signal.value: 
+    pinValue: int = self._pin_value()
+    if pinValue == self._released_v: 
       self._last_state = STATE.RELEASED
-    elif pinValue == self.pressed_signal.value: 
+    elif pinValue == self._pressed_v: 
       self._last_state = STATE.PRESSED
     else: 
       self._last_state = STATE.BOUNCING
     return self._last_state
   async def isReleased(self) -> bool:
     state = await self.getState()
-    return state == STATE.RELEASED
+    return state is STATE.RELEASED
   async def isPressed(self) -> bool:
     state = await self.getState()
-    return state == STATE.PRESSED
+    return state is STATE.PRESSED
   async def isToReleased(self) -> bool:
-    if self._last_state == STATE.BOUNCING: self._last_state = await self.getState()
-    if self._last_state == STATE.PRESSED:
+    if self._last_state is STATE.BOUNCING: self._last_state = await self.getState()
+    if self._last_state is STATE.PRESSED:
       await Sleep.async_ms(self.interval_ms)
       if await self.isReleased():
         return True
     return False
   async def isToPressed(self) -> bool:
-    if self._last_state == STATE.BOUNCING: self._last_state = await self.getState()
-    if self._last_state == STATE.RELEASED:
+    if self._last_state is STATE.BOUNCING: self._last_state = await self.getState()
+    if self._last_state is STATE.RELEASED:
       await Sleep.async_ms(self.interval_ms)
       if await self.isPressed():
         return True
     return False
 
+_EVT_PRESS = 1
+_EVT_RELEASE = 2
+
 class InterruptDrivenStateDebounceButton(StateDebounceButton):
-  class EdgeHandler(ListenerHandler.AsyncHandler):
-    def __init__(self, handler):
-      self.handler = handler
-    async def handle(self, obj = None, *args, **kwargs) -> None:
-      asyncio.create_task(self.handler())
-  def __init__(self, pin: machine.Pin, released_signal: Digital.Signal, 
+  _tracksPressTime: bool = True
+  def __init__(self, pin: "machine.Pin", released_signal: Digital.Signal, 
                interval_ms: int = 32, 
                log_name: str = "InterruptDrivenStateDebounceButton", log_level: Logging.Level = Logging.LEVEL.INFO):
     super().__init__(pin, released_signal, interval_ms, log_name, log_level)
     self._current_state: State = STATE.BOUNCING
-    self.pin.irq(trigger=Digital.IRQCode.IRQ_RISING | Digital.IRQCode.IRQ_FALLING, handler=self._irq_handler)
-    self._irq_flag: Flag.BooleanFlag = Flag.BooleanFlag()
-    self._irq_listenerHandler: ListenerHandler.SyncListenerAsyncHandler = ListenerHandler.SyncListenerAsyncHandler(Flag.BooleanFlagListener(self._irq_flag), InterruptDrivenStateDebounceButton.EdgeHandler(self._irq_agentHandler))
-    self._debounce_timer = Timer.AsyncTimer(interval_ms=self.interval_ms, callback=self._debounce_handler, callback_isAsync=True, repeat=False, log_name=f"{log_name}.DebounceTimer", log_level=log_level)
-    self._toReleased_flag: Flag.BooleanFlag = Flag.BooleanFlag()
-    self._toPressed_flag: Flag.BooleanFlag = Flag.BooleanFlag()
+    self.active: bool = False
+    self._debounce_task: asyncio.Task | None = None
+    self._irq_event = self._attachEdgeFlag()
+    self._pending: int = 0 # bitmask of _EVT_PRESS / _EVT_RELEASE not yet consumed by consumeToPressed/consumeToReleased
+    self._dispatch_pending: int = 0 # the same edges, kept separately for dispatchEvents so both consumers see every edge
+    self._wake: asyncio.Event = asyncio.Event()
+    self._toReleased_until: int = 0
+    self._toPressed_until: int = 0
+    self._last_edge_ms: int = utime.ticks_add(utime.ticks_ms(), -interval_ms)
   async def activate(self):
     self.logger.debug("[activate] Initializing InterruptDrivenStateDebounceButton...")
-    await self._debounce_timer.activate()
-    await self._irq_listenerHandler.activate()
-  def _irq_handler(self, pin: machine.Pin):
-    self._irq_flag.activate()
-  async def _irq_agentHandler(self):
-    self.logger.debug("[_irq_agentHandler] IRQ flag detected.")
-    self._last_state = self._current_state
-    self._current_state = STATE.BOUNCING
-    await self._debounce_timer.reactivate()
-    self._irq_flag.deactivate()
+    self.active = True
+    if self._debounce_task is None or self._debounce_task.done():
+      self._debounce_task = asyncio.create_task(self._debounce_loop())
+  async def _debounce_loop(self):
+    """Waits for an edge, then samples the pin once it has been quiet for `interval_ms`; runs for the whole activation instead of arming a timer per edge.
+
+    An edge arriving after at least `interval_ms` of quiet is sampled at once, so a clean click pays no debounce latency; only chatter waits out the window.
+    """
+    edge, wait_quiet, handle = self._irq_event, self._wait_quiet, self._debounce_handler
+    ticks_ms, ticks_diff = utime.ticks_ms, utime.ticks_diff
+    while self.active:
+      await edge.wait()
+      edge.clear()
+      now = ticks_ms()
+      quiet = ticks_diff(now, self._last_edge_ms) >= self.interval_ms
+      self._last_edge_ms = now
+      if self._dbg: self.logger.debug(f"[_debounce_loop] IRQ edge detected. quiet={quiet}")
+      if self._current_state is not STATE.BOUNCING:
+        self._last_state = self._current_state
+      self._current_state = STATE.BOUNCING
+      if not quiet: await wait_quiet()
+      await handle()
+  async def _wait_quiet(self):
+    """Returns once no edge has arrived for `interval_ms`; every further edge restarts the window."""
+    edge = self._irq_event
+    while True:
+      try: await _wait_for_ms(edge.wait(), self.interval_ms)
+      except asyncio.TimeoutError: return
+      edge.clear()
+      self._last_edge_ms = utime.ticks_ms()
   async def _debounce_handler(self):
-    pinValue: int = self.pin.value()
-    self.logger.debug(f"[_debounce_handler] Debounce handler triggered. pinValue={pinValue}, lastState={self._last_state}, currentState={self._current_state}")
-    if pinValue == self.released_signal.value: 
+    pinValue: int = self._pin_value()
+    if self._dbg: self.logger.debug(f"[_debounce_handler] Debounce handler triggered. pinValue={pinValue}, lastState={self._last_state}, currentState={self._current_state}")
+    if pinValue == self._released_v: 
       self._current_state = STATE.RELEASED
-    elif pinValue == self.pressed_signal.value: 
+    elif pinValue == self._pressed_v: 
       self._current_state = STATE.PRESSED
     else: 
-      await self._debounce_timer.reactivate()
+      self._irq_event.set()
       self.logger.warning("Pin state is still ambiguous after debounce.")
     
-    if self._current_state == STATE.RELEASED and self._last_state != STATE.RELEASED:
-      self._toReleased_flag.activate()
-      await Sleep.async_ms(self.interval_ms<<1)
-      self._toReleased_flag.deactivate()
-    elif self._current_state == STATE.PRESSED and self._last_state != STATE.PRESSED:
-      self._toPressed_flag.activate()
-      await Sleep.async_ms(self.interval_ms<<1)
-      self._toPressed_flag.deactivate()
+    # An edge stays visible for two debounce intervals; the deadline replaces sleeping here until it expires.
+    if self._current_state is STATE.RELEASED and self._last_state is not STATE.RELEASED:
+      self._toReleased_until = utime.ticks_add(utime.ticks_ms(), self.interval_ms<<1)
+      self._pending |= _EVT_RELEASE
+      self._dispatch_pending |= _EVT_RELEASE
+      self._wake.set()
+    elif self._current_state is STATE.PRESSED and self._last_state is not STATE.PRESSED:
+      self._pressed_at_ms = utime.ticks_ms()
+      self._toPressed_until = utime.ticks_add(self._pressed_at_ms, self.interval_ms<<1)
+      self._pending |= _EVT_PRESS
+      self._dispatch_pending |= _EVT_PRESS
+      self._wake.set()
   async def getState(self) -> State:
     await Sleep.async_ms(1)
     return self._current_state
   async def isReleased(self) -> bool:
     await Sleep.async_ms(1)
-    return self._current_state == STATE.RELEASED
+    return self._current_state is STATE.RELEASED
   async def isPressed(self) -> bool:
     await Sleep.async_ms(1)
-    return self._current_state == STATE.PRESSED
+    return self._current_state is STATE.PRESSED
   async def isBouncing(self) -> bool:
     await Sleep.async_ms(1)
-    return self._current_state == STATE.BOUNCING
-  async def isToReleased(self) -> bool:
-    if self._toReleased_flag.isActivate():
-      self._toReleased_flag.deactivate()
-      return True
+    return self._current_state is STATE.BOUNCING
+  def consumeToReleased(self) -> bool:
+    if self._pending & _EVT_RELEASE:
+      self._pending &= ~_EVT_RELEASE
+      return utime.ticks_diff(self._toReleased_until, utime.ticks_ms()) > 0
     return False
-  async def isToPressed(self) -> bool:
-    if self._toPressed_flag.isActivate():
-      self._toPressed_flag.deactivate()
-      return True
+  def consumeToPressed(self) -> bool:
+    if self._pending & _EVT_PRESS:
+      self._pending &= ~_EVT_PRESS
+      return utime.ticks_diff(self._toPressed_until, utime.ticks_ms()) > 0
     return False
+  async def dispatchEvents(self, on_pressed=None, on_released=None):
+    """Serves every edge handler of this button from one task: one wake-up and one bitmask read per debounced edge instead of a polling listener per event.
+
+    Args:
+      on_pressed: Called with no arguments on each debounced press edge.
+      on_released: Called with no arguments on each debounced release edge.
+
+    Edges are tracked apart from `consumeToPressed`/`consumeToReleased`, so this may run alongside `OnPressedListener`/`OnReleasedListener` on the same button; run at most one dispatcher per button. Returns once `deactivate()` is called.
+    """
+    wake = self._wake
+    while self.active:
+      await wake.wait()
+      wake.clear()
+      pending = self._dispatch_pending
+      if not pending: continue
+      self._dispatch_pending = 0
+      if pending & _EVT_PRESS and on_pressed is not None: on_pressed()
+      if pending & _EVT_RELEASE and on_released is not None: on_released()
+  async def isToReleased(self) -> bool:
+    return self.consumeToReleased()
+  async def isToPressed(self) -> bool:
+    return self.consumeToPressed()
   def deactivate(self):
-    self._debounce_timer.deactivate()
-    self._irq_listenerHandler.deactivate()
+    self.active = False
+    self._wake.set() # lets a waiting dispatchEvents see `active` is False and return
+    if self._debounce_task is not None:
+      self._debounce_task.cancel()
+    self._debounce_task = None
+
+class ButtonBank:
+  """Samples many buttons in a single coroutine and dispatches their edges via `asyncio.Event`.
+
+  Every registered pin is read in one burst per `interval_ms`, so N buttons cost one scheduler entry per sample window instead of N.
+  A pin's state only changes after `threshold` consecutive readings at the new level, so every listener of a member shares one debounced state.
+  """
+  class Member(BaseButton):
+    """Button-like facade of one pin registered in a `ButtonBank`."""
+    _tracksPressTime: bool = True
+    def __init__(self, pin: "machine.Pin", released_signal: Digital.Signal, interval_ms: int, log_name: str = "ButtonBank.Member", log_level: Logging.Level = Logging.LEVEL.INFO):
+      super().__init__(pin, released_signal, interval_ms, log_name, log_level)
+      self._current_state: State = STATE.BOUNCING
+      self._run: int = 0
+      self._toPressed_event: asyncio.Event = asyncio.Event()
+      self._toReleased_event: asyncio.Event = asyncio.Event()
+    async def getState(self) -> State:
+      return self._current_state
+    async def isReleased(self) -> bool:
+      return self._current_state is STATE.RELEASED
+    async def isPressed(self) -> bool:
+      return self._current_state is STATE.PRESSED
+    def consumeToReleased(self) -> bool:
+      if self._toReleased_event.is_set():
+        self._toReleased_event.clear()
+        return True
+      return False
+    def consumeToPressed(self) -> bool:
+      if self._toPressed_event.is_set():
+        self._toPressed_event.clear()
+        return True
+      return False
+    async def isToReleased(self) -> bool:
+      return self.consumeToReleased()
+    async def isToPressed(self) -> bool:
+      return self.consumeToPressed()
+
+  def __init__(self, interval_ms: int = 16, threshold: int = 2, log_name: str = "ButtonBank", log_level: Logging.Level = Logging.LEVEL.INFO):
+    self.interval_ms: int = interval_ms
+    self.threshold: int = threshold
+    self.log_level: Logging.Level = log_level
+    self.logger: Logging.Log = Logging.Log(log_name, log_level)
+    self._dbg: bool = self.logger.isEnabledFor(Logging.LEVEL.DEBUG)
+    self.active: bool = False
+    self._pins: "list[machine.Pin]" = []
+    self._members: list[ButtonBank.Member] = []
+    self._poll_task: asyncio.Task | None = None
+  def register(self, pin: "machine.Pin", released_signal: Digital.Signal, log_name: str = "ButtonBank.Member") -> "ButtonBank.Member":
+    """Registers a pin to the bank and returns its button-like facade.
 
-class OnPressedListener(ListenerHandler.AsyncListener):
-  def __init__(self, button: BaseButton, interval_ms: int = 10, log_name: str = "OnPressedListener", log_level: Logging.Level = Logging.LEVEL.INFO):
+    Args:
+      pin (machine.Pin): The digital pin of the button.
+      released_signal (Digital.Signal): The signal read while the button is released.
+      log_name (str, optional): The log name for the facade. Defaults to "ButtonBank.Member".
+
+    Returns:
+      ButtonBank.Member: The facade to pass to `OnPressedListener`/`OnReleasedListener`.
+    """
+    member = ButtonBank.Member(pin, released_signal, self.interval_ms, log_name, self.log_level)
+    self._pins.append(pin)
+    self._members.append(member)
+    return member
+  def _update(self, index: int, value: int) -> None:
+    member = self._members[index]
+    target = STATE.RELEASED if value == member._released_v else STATE.PRESSED
+    if target is member._current_state:
+      member._run = 0
+      return
+    member._run += 1
+    if member._run < self.threshold: return
+    member._run = 0
+    previous, member._current_state = member._current_state, target
+    if previous is STATE.BOUNCING: return # first settled reading after start-up: load it silently, it is not an edge
+    if target is STATE.RELEASED: member._toReleased_event.set()
+    else:
+      member._pressed_at_ms = utime.ticks_ms()
+      member._toPressed_event.set()
+  async def _poll_loop(self) -> None:
+    pins, update, sleep, interval_ms = self._pins, self._update, Sleep.async_ms, self.interval_ms
+    ticks_ms, ticks_add, ticks_diff = utime.ticks_ms, utime.ticks_add, utime.ticks_diff
+    next_tick = ticks_add(ticks_ms(), interval_ms)
+    while self.active:
+      values = tuple(p.value() for p in pins)
+      for i, v in enumerate(values):
+        update(i, v)
+      # Sample on a fixed tick grid so the window does not stretch by the time spent updating; resync if we fell behind.
+      delta = ticks_diff(next_tick, ticks_ms())
+      if delta < 0:
+        next_tick, delta = ticks_ms(), 0
+      await sleep(delta)
+      next_tick = ticks_add(next_tick, interval_ms)
+  async def activate(self) -> None:
+    if self._dbg: self.logger.debug(f"[activate] Sampling {len(self._pins)} buttons every {self.interval_ms}ms.")
+    self.active = True
+    if self._poll_task is None or self._poll_task.done():
+      self._poll_task = asyncio.create_task(self._poll_loop())
+  def deactivate(self) -> None:
+    self.active = False
+    if self._poll_task is not None:
+      self._poll_task.cancel()
+    self._poll_task = None
+
+class OnEdgeListener(ListenerHandler.AsyncListener):
+  def __init__(self, button: BaseButton, to_pressed: bool, interval_ms: int = 10, log_name: str = "OnEdgeListener", log_level: Logging.Level = Logging.LEVEL.INFO):
+    """Fires on the press edge of `button` if `to_pressed`, otherwise on its release edge.
+
+    The edge predicate is bound once here, so `listen()` is a single call.
+    """
     self.button: BaseButton = button
+    self.to_pressed: bool = to_pressed
     self.interval_ms: int = interval_ms
     self.logger: Logging.Log = Logging.Log(log_name, log_level)
+    self._check = button.isToPressed if to_pressed else button.isToReleased
   async def listen(self, obj = None, *args, **kwargs) -> bool:
-    return await self.button.isToPressed()
-class OnReleasedListener(ListenerHandler.AsyncListener):
-  def __init__(self, button: BaseButton, interval_ms: int = 10, log_name: str = "OnReleasedListener", log_level: Logging.Level = Logging.LEVEL.INFO):
+    return await self._check()
+class FlagListener(ListenerHandler.SyncListener):
+  def __init__(self, getter, log_name: str = "FlagListener", log_level: Logging.Level = Logging.LEVEL.INFO):
+    """Fires whenever the synchronous `getter` returns True, e.g. `button.consumeToPressed`.
+
+    For edge-publishing buttons this avoids creating a coroutine on every poll; pair it with a `ListenerHandler.SyncListener*Handler`.
+    """
+    self.getter = getter
+    self.logger: Logging.Log = Logging.Log(log_name, log_level)
+  def listen(self, obj = None, *args, **kwargs) -> bool:
+    return self.getter()
+def OnPressedListener(button: BaseButton, interval_ms: int = 10, log_name: str = "OnPressedListener", log_level: Logging.Level = Logging.LEVEL.INFO) -> OnEdgeListener:
+  return OnEdgeListener(button, True, interval_ms, log_name, log_level)
+def OnReleasedListener(button: BaseButton, interval_ms: int = 10, log_name: str = "OnReleasedListener", log_level: Logging.Level = Logging.LEVEL.INFO) -> OnEdgeListener:
+  return OnEdgeListener(button, False, interval_ms, log_name, log_level)
+class OnMultiClickListener(ListenerHandler.AsyncListener):
+  def __init__(self, button: BaseButton, clicks: int = 2, threshold: int = 8, timeout_ms: int = 600, log_name: str = "OnMultiClickListener", log_level: Logging.Level = Logging.LEVEL.INFO):
+    """Fires when `clicks` complete clicks of `button` land within `timeout_ms` of the first press.
+
+    Args:
+      button (BaseButton): The button to listen to; only its pin, released signal and interval are used.
+      clicks (int, optional): The number of clicks to detect. Defaults to 2.
+      threshold (int, optional): The number of consecutive equal readings to accept a level change. Defaults to 8.
+      timeout_ms (int, optional): The counting window in milliseconds. Defaults to 600.
+      log_name (str, optional): The log name. Defaults to "OnMultiClickListener".
+      log_level (Logging.Level, optional): The log level. Defaults to Logging.LEVEL.INFO.
+    """
     self.button: BaseButton = button
-    self.interval_ms: int = interval_ms
+    self.clicks: int = clicks
+    self.threshold: int = threshold
+    self.timeout_ms: int = timeout_ms
+    self.logger: Logging.Log = Logging.Log(log_name, log_level)
+  async def listen(self, obj = None, *args, **kwargs) -> bool:
+    button = self.button
+    if button._pin_value() == button._released_v: return False
+    return await DigitalFilters.countClicks_async(button.pin, button.released_signal, self.threshold, button.interval_ms, self.timeout_ms) == self.clicks
+class OnLongPressListener(ListenerHandler.AsyncListener):
+  def __init__(self, button: BaseButton, hold_ms: int = 800, log_name: str = "OnLongPressListener", log_level: Logging.Level = Logging.LEVEL.INFO):
+    """Fires once per press when `button` is held for `hold_ms`.
+
+    Args:
+      button (BaseButton): The button to listen to; only its pin, pressed signal and interval are used.
+      hold_ms (int, optional): How long the button has to be held, in milliseconds. Defaults to 800.
+      log_name (str, optional): The log name. Defaults to "OnLongPressListener".
+      log_level (Logging.Level, optional): The log level. Defaults to Logging.LEVEL.INFO.
+    """
+    self.button: BaseButton = button
+    self.hold_ms: int = hold_ms
     self.logger: Logging.Log = Logging.Log(log_name, log_level)
+    self._fired: bool = False
   async def listen(self, obj = None, *args, **kwargs) -> bool:
-    return await self.button.isToReleased()
+    button = self.button
+    if button._tracksPressTime: # debounced state and press time are already known: no pin sampling needed
+      if button._current_state is not STATE.PRESSED: # type: ignore
+        self._fired = False
+        return False
+      if self._fired: return False
+      self._fired = utime.ticks_diff(utime.ticks_ms(), button._pressed_at_ms) >= self.hold_ms
+      return self._fired
+    if button._pin_value() == button._released_v:
+      self._fired = False
+      return False
+    if self._fired: return False
+    self._fired = await DigitalFilters.holdStable_async(button.pin, button.pressed_signal, self.hold_ms, button.interval_ms)
+    return self._fired
 
 if __name__ == "__main__":
+  import machine
+
   class TestSyncHandler(ListenerHandler.SyncHandler):
     def __init__(self, log_name: str, log_level: Logging.Level = Logging.LEVEL.INFO):
       self.logger = Logging.Log(log_name, log_level)
@@ -257,12 +591,14 @@ if __name__ == "__main__":
     async def testSyncHandler():
       logger.info("Starting TestSyncHandler...")
       await btn_c.activate()
-      await ListenerHandler.AsyncListenerSyncHandler(OnPressedListener (btn_a, log_name="btn_a.OnPressedListener" , log_level=log_level), TestSyncHandler(log_name="btn_a.OnPressedHandler" , log_level=log_level), log_name="btn_a.OnPressedListenerSyncHandler" , log_level=log_level).activate()
-      await ListenerHandler.AsyncListenerSyncHandler(OnReleasedListener(btn_a, log_name="btn_a.OnReleasedListener", log_level=log_level), TestSyncHandler(log_name="btn_a.OnReleasedHandler", log_level=log_level), log_name="btn_a.OnReleasedListenerSyncHandler", log_level=log_level).activate()
-      await ListenerHandler.AsyncListenerSyncHandler(OnPressedListener (btn_b, log_name="btn_b.OnPressedListener" , log_level=log_level), TestSyncHandler(log_name="btn_b.OnPressedHandler" , log_level=log_level), log_name="btn_b.OnPressedListenerSyncHandler" , log_level=log_level).activate()
-      await ListenerHandler.AsyncListenerSyncHandler(OnReleasedListener(btn_b, log_name="btn_b.OnReleasedListener", log_level=log_level), TestSyncHandler(log_name="btn_b.OnReleasedHandler", log_level=log_level), log_name="btn_b.OnReleasedListenerSyncHandler", log_level=log_level).activate()
-      await ListenerHandler.AsyncListenerSyncHandler(OnPressedListener (btn_c, log_name="btn_c.OnPressedListener" , log_level=log_level), TestSyncHandler(log_name="btn_c.OnPressedHandler" , log_level=log_level), log_name="btn_c.OnPressedListenerSyncHandler" , log_level=log_level).activate()
-      await ListenerHandler.AsyncListenerSyncHandler(OnReleasedListener(btn_c, log_name="btn_c.OnReleasedListener", log_level=log_level), TestSyncHandler(log_name="btn_c.OnReleasedHandler", log_level=log_level), log_name="btn_c.OnReleasedListenerSyncHandler", log_level=log_level).activate()
+      await ListenerHandler.activateAll((
+        ListenerHandler.AsyncListenerSyncHandler(OnPressedListener (btn_a, log_name="btn_a.OnPressedListener" , log_level=log_level), TestSyncHandler(log_name="btn_a.OnPressedHandler" , log_level=log_level), log_name="btn_a.OnPressedListenerSyncHandler" , log_level=log_level),
+        ListenerHandler.AsyncListenerSyncHandler(OnReleasedListener(btn_a, log_name="btn_a.OnReleasedListener", log_level=log_level), TestSyncHandler(log_name="btn_a.OnReleasedHandler", log_level=log_level), log_name="btn_a.OnReleasedListenerSyncHandler", log_level=log_level),
+        ListenerHandler.AsyncListenerSyncHandler(OnPressedListener (btn_b, log_name="btn_b.OnPressedListener" , log_level=log_level), TestSyncHandler(log_name="btn_b.OnPressedHandler" , log_level=log_level), log_name="btn_b.OnPressedListenerSyncHandler" , log_level=log_level),
+        ListenerHandler.AsyncListenerSyncHandler(OnReleasedListener(btn_b, log_name="btn_b.OnReleasedListener", log_level=log_level), TestSyncHandler(log_name="btn_b.OnReleasedHandler", log_level=log_level), log_name="btn_b.OnReleasedListenerSyncHandler", log_level=log_level),
+        ListenerHandler.AsyncListenerSyncHandler(OnPressedListener (btn_c, log_name="btn_c.OnPressedListener" , log_level=log_level), TestSyncHandler(log_name="btn_c.OnPressedHandler" , log_level=log_level), log_name="btn_c.OnPressedListenerSyncHandler" , log_level=log_level),
+        ListenerHandler.AsyncListenerSyncHandler(OnReleasedListener(btn_c, log_name="btn_c.OnReleasedListener", log_level=log_level), TestSyncHandler(log_name="btn_c.OnReleasedHandler", log_level=log_level), log_name="btn_c.OnReleasedListenerSyncHandler", log_level=log_level),
+      ))
       while True:
         await Sleep.async_s(1)
     asyncio.run(testSyncHandler())
@@ -1,19 +1,28 @@
 # src/micropython_esp32_lib/Device/DHT.py
 import _thread as thread
 import asyncio
+from utime import ticks_ms, ticks_add, ticks_diff
 from machine import Pin
 import dht
 
+try: _wait_for_ms = asyncio.wait_for_ms # type: ignore
+except AttributeError: _wait_for_ms = lambda aw, timeout_ms: asyncio.wait_for(aw, timeout_ms/1000.0)
+
 try:
-  from ..System import Time
   from ..System import Sleep
   from ..Utils import Logging
 except ImportError:
-  from micropython_esp32_lib.System import Time
   from micropython_esp32_lib.System import Sleep
   from micropython_esp32_lib.Utils import Logging
 
 class DHT:
+  _thread_sensors: list = [] # sensors served by the shared monitor thread
+  _thread_lock = thread.allocate_lock()
+  _thread_running: bool = False
+  _thread_poll_ms: int = 100 # longest single sleep of the monitor thread
+  _instances: list = [] # sensors served by the shared monitor task
+  _scheduler_task: asyncio.Task | None = None
+  _scheduler_wake: asyncio.Event | None = None
   def __init__(self, pin: Pin, type: str = "DHT11", log_name: str = "DHT", log_level: Logging.Level = Logging.LEVEL.INFO) -> None:
     """DHT Sensor
 
@@ -37,124 +46,190 @@ class DHT:
       raise ValueError(f"Unsupported sensor type \"{type}\". Use \"DHT11\" or \"DHT22\".")
     
     self.temperature_C: float | int = 0
+    self.temperature_K: float = 273.15
+    self.temperature_F: float = 32.0
     self.humidity_ratio: float | int = 0
 
-    self.nextMeasureTime_ms = 0
+    self.nextMeasureTime_ms: int = ticks_ms() # ticks_ms deadline; compare only through ticks_diff
+    self._bus_lock = thread.allocate_lock()
+    self._measure_lock: asyncio.Lock = asyncio.Lock()
 
     self.measure_thread_enabled: bool = False
-    self.measure_thread_id: int | None = None
 
     self.measure_task_enabled: bool = False
-    self.measure_task: asyncio.Task | None = None
 
-  def _measure_sync_(self) -> tuple[float | int, float | int] | None:
+  def _read_sensor_(self) -> tuple[float | int, float | int]:
+    """Run one bus transaction and publish the sample.
+
+    `dht.DHTxx.measure` is not reentrant; if another thread or task is already on the bus, the cached sample is returned instead.
+    """
+    if not self._bus_lock.acquire(0):
+      return self.temperature_C, self.humidity_ratio
     try:
-      while Time.current_ms() < self.nextMeasureTime_ms:
-        Sleep.sync_ms(1)
       self.sensor.measure()
-      self.nextMeasureTime_ms: int = Time.current_ms() + self.samplingPeriod_ms
-      self.temperature_C: float | int = self.sensor.temperature()
-      self.humidity_ratio: float | int = self.sensor.humidity()
-      return self.temperature_C, self.humidity_ratio
+      self.nextMeasureTime_ms = ticks_add(ticks_ms(), self.samplingPeriod_ms)
+      self.temperature_C = self.sensor.temperature()
+      self.temperature_K = self.temperature_C + 273.15
+      self.temperature_F = self.temperature_C * 1.8 + 32.0
+      self.humidity_ratio = self.sensor.humidity()
+    finally:
+      self._bus_lock.release()
+    return self.temperature_C, self.humidity_ratio
+  def _measure_sync_(self) -> tuple[float | int, float | int] | None:
+    try:
+      delta_ms = ticks_diff(self.nextMeasureTime_ms, ticks_ms())
+      if delta_ms > 0:
+        Sleep.sync_ms(delta_ms)
+      return self._read_sensor_()
     except Exception as e:
       self.logger.error(f"[_measure_sync_] Failed to measure: {e}")
       return None
   async def _measure_async_(self) -> tuple[float | int, float | int] | None:
     try:
-      while Time.current_ms() < self.nextMeasureTime_ms:
-        await Sleep.async_ms(1)
-      self.sensor.measure()
-      self.nextMeasureTime_ms: int = Time.current_ms() + self.samplingPeriod_ms
-      self.temperature_C: float | int = self.sensor.temperature()
-      self.humidity_ratio: float | int = self.sensor.humidity()
-      return self.temperature_C, self.humidity_ratio
+      pending_ms = self.nextMeasureTime_ms
+      async with self._measure_lock:
+        if self.nextMeasureTime_ms != pending_ms: # measured while we were queued: share that sample
+          return self.temperature_C, self.humidity_ratio
+        delta_ms = ticks_diff(self.nextMeasureTime_ms, ticks_ms())
+        if delta_ms > 0:
+          await Sleep.async_ms(delta_ms)
+        return self._read_sensor_()
     except Exception as e:
       self.logger.error(f"[_measure_async_] Failed to measure: {e}")
       return None
 
-  def _monitor_sync_(self) -> None: # TODO: consider moving this monitoring pattern to System/EventHandler
-    """Measure temperature and humidity"""
-    try:
-      while self.measure_thread_enabled:
-        self._measure_sync_()
-    except Exception as e:
-      self.logger.error(f"[_monitor_sync_] Failed to monitor: {e}")
-  async def _monitor_async_(self) -> None: # TODO: consider moving this monitoring pattern to System/EventHandler
-    """Measure temperature and humidity"""
+  @classmethod
+  def _monitor_sync_(cls) -> None: # TODO: consider moving this monitoring pattern to System/EventHandler
+    """Measure every sensor registered by `startMonitor_sync` from the one shared thread, always taking the earliest deadline next."""
+    sensors, lock = cls._thread_sensors, cls._thread_lock
+    while True:
+      with lock:
+        if not sensors:
+          cls._thread_running = False
+          return
+        now = ticks_ms()
+        sensor = sensors[0]
+        delta = ticks_diff(sensor.nextMeasureTime_ms, now)
+        for other in sensors:
+          other_delta = ticks_diff(other.nextMeasureTime_ms, now)
+          if other_delta < delta: sensor, delta = other, other_delta
+      if delta > 0:
+        Sleep.sync_ms(min(delta, cls._thread_poll_ms)) # bounded, so sensors started or stopped meanwhile are picked up
+        continue
+      try: sensor._read_sensor_()
+      except Exception as e: sensor.logger.error(f"[_monitor_sync_] Failed to measure: {e}")
+      if ticks_diff(sensor.nextMeasureTime_ms, ticks_ms()) <= 0: # failed or bus busy: retry next period instead of spinning
+        sensor.nextMeasureTime_ms = ticks_add(ticks_ms(), sensor.samplingPeriod_ms)
+  @classmethod
+  async def _monitor_async_(cls) -> None: # TODO: consider moving this monitoring pattern to System/EventHandler
+    """Measure every sensor registered by `startMonitor_async` from the one shared task, always taking the earliest deadline next."""
+    sensors, wake = cls._instances, cls._scheduler_wake
     try:
-      while self.measure_thread_enabled:
-        await self._measure_async_()
-    except Exception as e:
-      self.logger.error(f"[_monitor_async_] Failed to monitor: {e}")
+      while sensors:
+        now = ticks_ms()
+        sensor = sensors[0]
+        delta = ticks_diff(sensor.nextMeasureTime_ms, now)
+        for other in sensors:
+          other_delta = ticks_diff(other.nextMeasureTime_ms, now)
+          if other_delta < delta: sensor, delta = other, other_delta
+        if delta > 0:
+          wake.clear() # type: ignore
+          try: await _wait_for_ms(wake.wait(), delta) # type: ignore
+          except asyncio.TimeoutError: pass
+          continue
+        await sensor._measure_async_()
+        if ticks_diff(sensor.nextMeasureTime_ms, ticks_ms()) <= 0: # failed or bus busy: retry next period instead of spinning
+          sensor.nextMeasureTime_ms = ticks_add(ticks_ms(), sensor.samplingPeriod_ms)
+    finally:
+      cls._scheduler_task = None
 
   def startMonitor_sync(self) -> None: # TODO: consider moving this monitoring pattern to System/EventHandler
-    """Start measuring in thread"""
+    """Start measuring in thread
+
+    Deprecated: prefer `startMonitor_async`. ESP32 ports allow only one or two user threads, so all `DHT` instances now share a single monitor thread instead of starting one each.
+    """
     if not self.measure_thread_enabled:
+      self.logger.warning("startMonitor_sync is deprecated; use startMonitor_async.")
       self.measure_thread_enabled = True
-      self.measure_thread_id = thread.start_new_thread(self._monitor_sync_, ())
-      self.logger.info("Started synchronous DHT monitoring thread.")
+      cls = DHT
+      with cls._thread_lock:
+        cls._thread_sensors.append(self)
+        if not cls._thread_running:
+          cls._thread_running = True
+          thread.start_new_thread(cls._monitor_sync_, ())
+      self.logger.info("Started synchronous DHT monitoring on the shared thread.")
   def startMonitor_async(self) -> None: # TODO: consider moving this monitoring pattern to System/EventHandler
-    """Start measuring in task"""
+    """Start measuring in task
+
+    All `DHT` instances share one monitor task, which measures whichever sensor is due next.
+    """
     if not self.measure_task_enabled:
       self.measure_task_enabled = True
-      self.measure_task = asyncio.create_task(self._monitor_async_())
-      self.logger.info("Started asynchronous DHT monitoring task.")
+      cls = DHT
+      cls._instances.append(self)
+      if cls._scheduler_task is None:
+        cls._scheduler_wake = asyncio.Event()
+        cls._scheduler_task = asyncio.create_task(cls._monitor_async_())
+      else:
+        cls._scheduler_wake.set() # type: ignore
+      self.logger.info("Started asynchronous DHT monitoring on the shared task.")
 
   def stopMonitor_sync(self) -> None: # TODO: consider moving this monitoring pattern to System/EventHandler
     """Stop measuring"""
     if self.measure_thread_enabled:
       self.measure_thread_enabled = False
-      self.measure_thread_id = None
-      self.logger.info("Stopped synchronous DHT monitoring thread.")
+      with DHT._thread_lock:
+        DHT._thread_sensors.remove(self)
+      self.logger.info("Stopped synchronous DHT monitoring.")
   def stopMonitor_async(self) -> None: # TODO: consider moving this monitoring pattern to System/EventHandler
     """Stop measuring"""
     if self.measure_task_enabled:
       self.measure_task_enabled = False
-      if self.measure_task:
-          self.measure_task.cancel() # Safely cancel the task
-      self.measure_task = None
-      self.logger.info("Stopped asynchronous DHT monitoring task.")
+      cls = DHT
+      cls._instances.remove(self)
+      if cls._scheduler_task is not None:
+        cls._scheduler_wake.set() # type: ignore
+      self.logger.info("Stopped asynchronous DHT monitoring.")
+
+  def refresh_sync(self) -> None:
+    """Measure again if the last sample is older than the sampling period.
+
+    The getters below only return the cached sample; call this (or run a monitor, the canonical refresher) to keep it current.
+    """
+    if ticks_diff(self.nextMeasureTime_ms, ticks_ms()) <= 0:
+      self._measure_sync_()
+  async def refresh_async(self) -> None:
+    """Measure again if the last sample is older than the sampling period.
+
+    The getters below only return the cached sample; call this (or run a monitor, the canonical refresher) to keep it current.
+    """
+    if ticks_diff(self.nextMeasureTime_ms, ticks_ms()) <= 0:
+      await self._measure_async_()
 
   def Temperature_C_sync(self) -> float | None: # TODO: consider exposing through an EventHandler pattern
     """Get temperature in Celsius"""
-    if Time.current_ms() > self.nextMeasureTime_ms:
-      self._measure_sync_()
     return self.temperature_C
   def Temperature_K_sync(self) -> float | None: # TODO: consider exposing through an EventHandler pattern
     """Get temperature in Kelvin"""
-    if Time.current_ms() > self.nextMeasureTime_ms:
-      self._measure_sync_()
-    return self.temperature_C + 273.15
+    return self.temperature_K
   def Temperature_F_sync(self) -> float | None: # TODO: consider exposing through an EventHandler pattern
     """Get temperature in Fahrenheit"""
-    if Time.current_ms() > self.nextMeasureTime_ms:
-      self._measure_sync_()
-    return self.temperature_C * (9/5) + 32.0
+    return self.temperature_F
   def Humidity_ratio_sync(self) -> float | int | None: # TODO: consider exposing through an EventHandler pattern
     """Get humidity ratio"""
-    if Time.current_ms() > self.nextMeasureTime_ms:
-      self._measure_sync_()
     return self.humidity_ratio
 
   async def Temperature_C_async(self) -> float | None: # TODO: consider exposing through an EventHandler pattern
     """Get temperature in Celsius"""
-    if Time.current_ms() > self.nextMeasureTime_ms:
-      await self._measure_async_()
     return self.temperature_C
   async def Temperature_K_async(self) -> float | None: # TODO: consider exposing through an EventHandler pattern
     """Get temperature in Kelvin"""
-    if Time.current_ms() > self.nextMeasureTime_ms:
-      await self._measure_async_()
-    return self.temperature_C + 273.15
+    return self.temperature_K
   async def Temperature_F_async(self) -> float | None: # TODO: consider exposing through an EventHandler pattern
     """Get temperature in Fahrenheit"""
-    if Time.current_ms() > self.nextMeasureTime_ms:
-      await self._measure_async_()
-    return self.temperature_C * (9/5) + 32.0
+    return self.temperature_F
   async def Humidity_ratio_async(self) -> float | int | None: # TODO: consider exposing through an EventHandler pattern
     """Get humidity ratio"""
-    if Time.current_ms() > self.nextMeasureTime_ms:
-      await self._measure_async_()
     return self.humidity_ratio
 
 if __name__ == "__main__":
@@ -166,6 +241,7 @@ if __name__ == "__main__":
     try:
       while True:
         Sleep.sync_ms(dht_sensor.samplingPeriod_ms)
+        dht_sensor.refresh_sync()
         logger_main.info(f'Temperature: {dht_sensor.Temperature_K_sync():3.1f} K')
         logger_main.info(f'Temperature: {dht_sensor.Temperature_C_sync():3.1f} C')
         logger_main.info(f'Temperature: {dht_sensor.Temperature_F_sync():3.1f} F')
@@ -183,6 +259,7 @@ if __name__ == "__main__":
     try:
       while True:
         await Sleep.async_ms(dht_sensor.samplingPeriod_ms)
+        await dht_sensor.refresh_async()
         logger_main.info(f'Temperature: {(await dht_sensor.Temperature_K_async()):3.1f} K')
         logger_main.info(f'Temperature: {(await dht_sensor.Temperature_C_async()):3.1f} C')
         logger_main.info(f'Temperature: {(await dht_sensor.Temperature_F_async()):3.1f} F')
@@ -12,23 +12,100 @@ except ImportError:
   from micropython_esp32_lib.Utils import Logging
   from micropython_esp32_lib.System import Sleep
 
+try:
+  import micropython
+except ImportError:
+  micropython = None
+
+if micropython is not None:
+  @micropython.viper
+  def _blit_rgb(buf: ptr8, src_r: ptr8, src_g: ptr8, src_b: ptr8, n: int, bpp: int, o_r: int, o_g: int, o_b: int): # type: ignore
+    # Interleaves the three channel buffers into the NeoPixel buffer; `o_*` are the byte offsets of each channel within a pixel.
+    i = 0
+    j = 0
+    while i < n:
+      buf[j + o_r] = src_r[i]
+      buf[j + o_g] = src_g[i]
+      buf[j + o_b] = src_b[i]
+      i += 1
+      j += bpp
+  @micropython.viper
+  def _lerp_u8_into(dst: ptr8, a: ptr8, b: ptr8, i: int, inv: int, n: int): # type: ignore
+    # dst[k] = a[k] + (b[k] - a[k]) * i / rounds for k < n, with `inv = (1 << 22) // rounds` from the caller (viper has no division).
+    # For i <= rounds, f <= 2**22 and 255 * f stays below 2**31; differences are kept non-negative so the shift never rounds below zero.
+    f = i * inv
+    k = 0
+    while k < n:
+      x = int(a[k])
+      y = int(b[k])
+      if y >= x: dst[k] = x + (((y - x) * f) >> 22)
+      else: dst[k] = x - (((x - y) * f) >> 22)
+      k += 1
+  @micropython.viper
+  def _lerp_frames_u8(frames: ptr8, a: ptr8, b: ptr8, rounds: int, inv: int, n: int): # type: ignore
+    # Fills `rounds` consecutive n-byte frames; frame i is `_lerp_u8_into(..., i, inv, n)` with `inv = (1 << 22) // rounds`.
+    i = 0
+    j = 0
+    f = 0 # i * inv, stepped instead of multiplied
+    while i < rounds:
+      k = 0
+      while k < n:
+        x = int(a[k])
+        y = int(b[k])
+        if y >= x: frames[j] = x + (((y - x) * f) >> 22)
+        else: frames[j] = x - (((x - y) * f) >> 22)
+        k += 1
+        j += 1
+      i += 1
+      f += inv
+else:
+  def _blit_rgb(buf, src_r, src_g, src_b, n: int, bpp: int, o_r: int, o_g: int, o_b: int):
+    j = 0
+    for i in range(n):
+      buf[j + o_r] = src_r[i]
+      buf[j + o_g] = src_g[i]
+      buf[j + o_b] = src_b[i]
+      j += bpp
+  def _lerp_u8_into(dst, a, b, i: int, inv: int, n: int):
+    f = i * inv
+    for k in range(n):
+      x, y = a[k], b[k]
+      if y >= x: dst[k] = x + (((y - x) * f) >> 22)
+      else: dst[k] = x - (((x - y) * f) >> 22)
+  def _lerp_frames_u8(frames, a, b, rounds: int, inv: int, n: int):
+    for i in range(rounds):
+      _lerp_u8_into(memoryview(frames)[i * n:], a, b, i, inv, n)
+
 class LED:
   def __init__(self, pin: machine.Pin, statuOn_dutyRatio: float = 1.0, statuOff_dutyRatio: float = 0.0, frequency_Hz: int = 256) -> None:
     self.pin_pwm: machine.PWM = machine.PWM(pin, freq=frequency_Hz)
     self.statuOn_dutyu16: int = int(Utils.mapping(statuOn_dutyRatio, 0.0, 1.0, 0.0, Utils.UINT16_MAX))
     self.statuOff_dutyu16: int = int(Utils.mapping(statuOff_dutyRatio, 0.0, 1.0, 0.0, Utils.UINT16_MAX))
+    self._slope: int = self.statuOn_dutyu16 - self.statuOff_dutyu16 # `set` maps 0..1 linearly onto off..on duty
+    self._offset: int = self.statuOff_dutyu16
+    self._is_on: bool = False # mirrors `duty == statuOn_dutyu16`, so `toggle` need not read the duty back
     # No logger added here, as it's a very low-level component, and logging might be too verbose.
     # Higher-level components can log their usage of LED.
   def on(self) -> None:
     self.pin_pwm.duty_u16(self.statuOn_dutyu16)
+    self._is_on = True
   def off(self) -> None:
     self.pin_pwm.duty_u16(self.statuOff_dutyu16)
+    self._is_on = False
   def set(self, value: float) -> None:
-    # Map 'value' from 0-1 to the range defined by statuOff_dutyu16 to statuOn_dutyu16
-    self.pin_pwm.duty_u16(int(Utils.mapping(value, 0, 1, self.statuOff_dutyu16, self.statuOn_dutyu16)))
+    # Map 'value' from 0-1 to the range defined by statuOff_dutyu16 to statuOn_dutyu16 (clamped, as Utils.mapping did)
+    if value < 0: value = 0
+    elif value > 1: value = 1
+    duty = int(value * self._slope + self._offset)
+    self.pin_pwm.duty_u16(duty)
+    self._is_on = duty == self.statuOn_dutyu16
+  def _set_u8(self, value: int) -> None:
+    # `set` for a trusted 0-255 value, in integer math only.
+    duty = self._offset + self._slope * value // Utils.UINT08_MAX
+    self.pin_pwm.duty_u16(duty)
+    self._is_on = duty == self.statuOn_dutyu16
   def toggle(self) -> None:
-    current_duty = self.pin_pwm.duty_u16()
-    if current_duty == self.statuOn_dutyu16:
+    if self._is_on:
       self.off()
     else:
       self.on()
@@ -39,45 +116,117 @@ class RGBLED:
     self.pinG: LED = pinG
     self.pinB: LED = pinB
     self.pinAlpha: LED | None = pinAlpha
+    # Bound once so a fade step does not resolve `self.pinX.set` per channel.
+    self._setR = pinR.set
+    self._setG = pinG.set
+    self._setB = pinB.set
+    self._setA = pinAlpha.set if pinAlpha is not None else None
+    self._setR_u8 = pinR._set_u8
+    self._setG_u8 = pinG._set_u8
+    self._setB_u8 = pinB._set_u8
+    self._setA_u8 = pinAlpha._set_u8 if pinAlpha is not None else None
   def set_ratio(self, r: float, g: float, b: float, a: float = 1.0) -> None:
-    if 0.0 <= r <= 1.0 and 0.0 <= g <= 1.0 and 0.0 <= b <= 1.0 and 0.0 <= a <= 1.0:
-      self.pinR.set(r)
-      self.pinG.set(g)
-      self.pinB.set(b)
-      if self.pinAlpha is not None:
-        self.pinAlpha.set(a)
+    if 0.0 <= min(r, g, b, a) and max(r, g, b, a) <= 1.0:
+      self._setR(r)
+      self._setG(g)
+      self._setB(b)
+      setA = self._setA
+      if setA is not None:
+        setA(a)
     else:
       raise ValueError("r, g, b, a must be 0.0 <= value <= 1.0")
   def set_color(self, r: int, g: int, b: int, a: int = Utils.UINT08_MAX) -> None: # Using Utils.UINT08_MAX
-    if 0 <= r <= Utils.UINT08_MAX and 0 <= g <= Utils.UINT08_MAX and 0 <= b <= Utils.UINT08_MAX and 0 <= a <= Utils.UINT08_MAX:
-      self.set_ratio(r / Utils.UINT08_MAX, g / Utils.UINT08_MAX, b / Utils.UINT08_MAX, a / Utils.UINT08_MAX)
+    if 0 <= min(r, g, b, a) and max(r, g, b, a) <= Utils.UINT08_MAX:
+      self._set_bytes(r, g, b, a)
     else:
       raise ValueError("r, g, b, a must be 0 <= value <= 255")
+  def _set_bytes(self, r: int, g: int, b: int, a: int) -> None:
+    # Trusts already validated 0-255 inputs: no second range check and no float conversion.
+    self._setR_u8(r)
+    self._setG_u8(g)
+    self._setB_u8(b)
+    setA = self._setA_u8
+    if setA is not None:
+      setA(a)
   def set_RGBA(self, rgba: Utils.RGBA) -> None:
     self.set_color(rgba.r, rgba.g, rgba.b, rgba.a)
 
 class RGBLEDPixels:
+  """NeoPixel strip whose colours live in the `r`, `g`, `b` channel arrays.
+
+  Every update is interleaved by `_blit_rgb` straight into the driver's own `neopixel.buf` (exposed as `buf`) in the strip's byte order, so no per-pixel `NeoPixel.__setitem__` call is made.
+  """
   def __init__(self, pin: machine.Pin, size: int, bpp: int = 3, timing: int = 1, pixels: list[Utils.RGB] | None = None) -> None:
     self.pin: machine.Pin = pin
     self.size: int = size
     self.neopixel: neopixel.NeoPixel = neopixel.NeoPixel(pin, size, bpp=bpp, timing=timing)
-    self.pixels: list[Utils.RGB] = [Utils.RGB(0, 0, 0) for _ in range(size)]
+    self.buf: bytearray = self.neopixel.buf
+    self.bpp: int = bpp
+    order = getattr(self.neopixel, "ORDER", (1, 0, 2, 3)) # byte offset of R, G, B within a pixel (GRB on WS2812)
+    self._order: tuple[int, int, int] = (order[0], order[1], order[2])
+    # Pixel colours are stored as three channel arrays rather than a list of `Utils.RGB` objects.
+    self.r: bytearray = bytearray(size)
+    self.g: bytearray = bytearray(size)
+    self.b: bytearray = bytearray(size)
     if pixels is not None:
       self.set(pixels)
   def set(self, pixels: list[Utils.RGB]) -> None:
+    self.set_no_write(pixels)
+    self.flush()
+  def set_no_write(self, pixels: list[Utils.RGB]) -> None:
+    """Stores `pixels` without sending them to the strip; call `flush` once the whole frame is built.
+
+    Args:
+      pixels (list[Utils.RGB]): One colour per pixel.
+    """
     # Ensure the new list has the correct size
     if len(pixels) != self.size:
         raise ValueError(f"Expected {self.size} pixels, but got {len(pixels)}")
-    self.pixels = pixels # Update internal reference first
-    for i in range(self.size):
-      self.neopixel[i] = self.pixels[i].get() # Use self.pixels[i] directly
+    r, g, b = self.r, self.g, self.b
+    for i in range(self.size): # indexing avoids the tuple `enumerate` allocates per pixel
+      p = pixels[i]
+      r[i] = p.r
+      g[i] = p.g
+      b[i] = p.b
+  def set_channels(self, r: bytearray, g: bytearray, b: bytearray) -> None:
+    """Sets every pixel from three channel buffers without building any `Utils.RGB` objects.
+
+    Args:
+      r (bytearray): Red values, one byte per pixel.
+      g (bytearray): Green values, one byte per pixel.
+      b (bytearray): Blue values, one byte per pixel.
+    """
+    size = self.size
+    if len(r) != size or len(g) != size or len(b) != size:
+        raise ValueError(f"Expected {size} bytes per channel")
+    self.r[:] = r
+    self.g[:] = g
+    self.b[:] = b
+    self.flush()
+  def flush(self) -> None:
+    """Interleaves the stored channels into the NeoPixel buffer and sends it to the strip in one transfer."""
+    o_r, o_g, o_b = self._order
+    _blit_rgb(self.buf, self.r, self.g, self.b, self.size, self.bpp, o_r, o_g, o_b)
     self.neopixel.write()
+  def get_into(self, r: bytearray, g: bytearray, b: bytearray) -> None:
+    """Copies the current channels into caller-owned buffers, allocating nothing; prefer this over `get` in loops.
+
+    Args:
+      r (bytearray): Receives the red values, one byte per pixel.
+      g (bytearray): Receives the green values, one byte per pixel.
+      b (bytearray): Receives the blue values, one byte per pixel.
+    """
+    r[:] = self.r
+    g[:] = self.g
+    b[:] = self.b
   def get(self) -> list[Utils.RGB]:
-    # It's better to return a copy if the user might modify it and expect no change to internal state without calling set.
-    return [Utils.RGB(p.r, p.g, p.b) for p in self.pixels] # Return a copy of Utils.RGB objects
+    # Utils.RGB objects are only built here, on request; they are copies, so modifying them needs a `set` to take effect.
+    r, g, b = self.r, self.g, self.b
+    return [Utils.RGB(r[i], g[i], b[i]) for i in range(self.size)]
 
 if __name__ == "__main__":
   import urandom
+  import utime
   logger_main = Logging.Log("LED_Test", Logging.LEVEL.INFO)
   
   # Test 1: LED
@@ -131,27 +280,28 @@ if __name__ == "__main__":
   )
   try:
     
-    r_init, g_init, b_init = urandom.randint(0, Utils.UINT08_MAX), urandom.randint(0, Utils.UINT08_MAX), urandom.randint(0, Utils.UINT08_MAX)
-    alpha = urandom.randint(100, Utils.UINT08_MAX) # Initial alpha for test
-    rgbled.set_color(r_init, g_init, b_init, alpha)
-    logger_main.info(f"Initial Utils.RGBA: ({r_init:03d}, {g_init:03d}, {b_init:03d}, {alpha:03d})")
+    rgba_init = bytearray((urandom.randint(0, Utils.UINT08_MAX), urandom.randint(0, Utils.UINT08_MAX), urandom.randint(0, Utils.UINT08_MAX), urandom.randint(100, Utils.UINT08_MAX))) # alpha >= 100 for test
+    rgba_tmp = bytearray(4)
+    rgbled.set_color(*rgba_init)
+    logger_main.info(f"Initial Utils.RGBA: ({rgba_init[0]:03d}, {rgba_init[1]:03d}, {rgba_init[2]:03d}, {rgba_init[3]:03d})")
 
     while True:
-      r_target, g_target, b_target = urandom.randint(0, Utils.UINT08_MAX), urandom.randint(0, Utils.UINT08_MAX), urandom.randint(0, Utils.UINT08_MAX)
-      alpha_target = urandom.randint(100, Utils.UINT08_MAX)
+      rgba_target = bytearray((urandom.randint(0, Utils.UINT08_MAX), urandom.randint(0, Utils.UINT08_MAX), urandom.randint(0, Utils.UINT08_MAX), urandom.randint(100, Utils.UINT08_MAX)))
       rounds: int = urandom.randint(300, 600)
       
-      logger_main.info(f"Fading to Utils.RGBA: ({r_target:03d}, {g_target:03d}, {b_target:03d}, {alpha_target:03d}) over {rounds} steps.")
+      logger_main.info(f"Fading to Utils.RGBA: ({rgba_target[0]:03d}, {rgba_target[1]:03d}, {rgba_target[2]:03d}, {rgba_target[3]:03d}) over {rounds} ms.")
       
-      for i in range(rounds):
-        r_tmp = Utils.mapping(i, 0, rounds, r_init, r_target)
-        g_tmp = Utils.mapping(i, 0, rounds, g_init, g_target)
-        b_tmp = Utils.mapping(i, 0, rounds, b_init, b_target)
-        a_tmp = Utils.mapping(i, 0, rounds, alpha, alpha_target)
-        rgbled.set_color(int(r_tmp), int(g_tmp), int(b_tmp), int(a_tmp))
+      # The step is the elapsed time, so the fade lasts `rounds` ms however long each frame takes; late frames are simply skipped.
+      inv = (1 << 22) // rounds # fixed-point 1/rounds for the division-free kernel
+      start = utime.ticks_ms()
+      i = 0
+      while i < rounds:
+        _lerp_u8_into(rgba_tmp, rgba_init, rgba_target, i, inv, 4)
+        rgbled.set_color(rgba_tmp[0], rgba_tmp[1], rgba_tmp[2], rgba_tmp[3])
         Sleep.sync_ms(1)
+        i = utime.ticks_diff(utime.ticks_ms(), start)
       
-      r_init, g_init, b_init, alpha = r_target, g_target, b_target, alpha_target
+      rgba_init = rgba_target
       Sleep.sync_ms(500) # Short pause before next fade
   except KeyboardInterrupt:
     logger_main.info("RGBLED test interrupted.")
@@ -177,23 +327,30 @@ if __name__ == "__main__":
   logger_main.info(f"Initial NeoPixel Utils.RGB values: {[p.get() for p in rgbLedPixels.get()]}")
   try:
 
+    old_r, old_g, old_b = bytearray(size), bytearray(size), bytearray(size)
+    # Every frame of a fade is computed up front; showing frame i is then three slice copies and one blit.
+    max_rounds: int = 600
+    frames_r, frames_g, frames_b = memoryview(bytearray(max_rounds * size)), memoryview(bytearray(max_rounds * size)), memoryview(bytearray(max_rounds * size))
     while True:
-      old_pixels: list[Utils.RGB] = rgbLedPixels.get()
-      new_pixels: list[Utils.RGB] = [Utils.RGB(urandom.randint(0, Utils.UINT08_MAX), urandom.randint(0, Utils.UINT08_MAX), urandom.randint(0, Utils.UINT08_MAX)) for _ in range(size)]
-      rounds: int = urandom.randint(300, 600)
+      rgbLedPixels.get_into(old_r, old_g, old_b)
+      new_r = bytearray(urandom.randint(0, Utils.UINT08_MAX) for _ in range(size))
+      new_g = bytearray(urandom.randint(0, Utils.UINT08_MAX) for _ in range(size))
+      new_b = bytearray(urandom.randint(0, Utils.UINT08_MAX) for _ in range(size))
+      rounds: int = urandom.randint(300, max_rounds)
       
-      logger_main.info(f"Fading NeoPixels to new colors over {rounds} steps.")
+      logger_main.info(f"Fading NeoPixels to new colors over {rounds} ms.")
       
-      tmp_pixels_list: list[Utils.RGB] = []
-      for i in range(rounds):
-        tmp_pixels_list.clear() # Clear for new frame
-        for j in range(size):
-          r_tmp = Utils.mapping(i, 0, rounds, old_pixels[j].r, new_pixels[j].r)
-          g_tmp = Utils.mapping(i, 0, rounds, old_pixels[j].g, new_pixels[j].g)
-          b_tmp = Utils.mapping(i, 0, rounds, old_pixels[j].b, new_pixels[j].b)
-          tmp_pixels_list.append(Utils.RGB(int(r_tmp), int(g_tmp), int(b_tmp)))
-        rgbLedPixels.set(tmp_pixels_list)
+      inv = (1 << 22) // rounds # fixed-point 1/rounds for the division-free kernels
+      _lerp_frames_u8(frames_r, old_r, new_r, rounds, inv, size)
+      _lerp_frames_u8(frames_g, old_g, new_g, rounds, inv, size)
+      _lerp_frames_u8(frames_b, old_b, new_b, rounds, inv, size)
+      start = utime.ticks_ms()
+      i = 0
+      while i < rounds: # frame i is shown at i ms; frames that fall behind are skipped
+        j = i * size
+        rgbLedPixels.set_channels(frames_r[j:j + size], frames_g[j:j + size], frames_b[j:j + size])
         Sleep.sync_ms(1)
+        i = utime.ticks_diff(utime.ticks_ms(), start)
       
       logger_main.info(f"Current NeoPixel Utils.RGB values: {[p.get() for p in rgbLedPixels.get()]}")
       Sleep.sync_ms(500) # Short pause before next fade
@@ -10,12 +10,46 @@ except ImportError:
   from micropython_esp32_lib.Utils import Logging
   from micropython_esp32_lib.System import Sleep
 
+try:
+  import micropython
+except ImportError:
+  micropython = None
+
+_RESCALE_SHIFT = 14 # fixed-point bits of the rescale factor; keeps every product below 2**30
+
+if micropython is not None:
+  @micropython.viper
+  def _rescale_u16(v: int, base: int, span: int, k: int) -> int:
+    # Maps `v` from [base, base + span] onto [0, 0xFFFF], clamped; `k` is 0xFFFF / span in 14-bit fixed point.
+    d = v - base
+    if span > 0:
+      if d <= 0: return 0
+      if d >= span: return 0xFFFF
+    else:
+      if d >= 0: return 0
+      if d <= span: return 0xFFFF
+    return (d * k) >> 14
+else:
+  def _rescale_u16(v: int, base: int, span: int, k: int) -> int:
+    d = v - base
+    if span > 0:
+      if d <= 0: return 0
+      if d >= span: return 0xFFFF
+    else:
+      if d >= 0: return 0
+      if d <= span: return 0xFFFF
+    return (d * k) >> _RESCALE_SHIFT
+
 class LightSensor: # TODO: samplingTimes: int = 10, interval_ms: int = 10
   def __init__(self, pin: Pin, signal_highLight: int = Utils.UINT16_MAX, signal_lowLight: int = 0, log_name: str = "LightSensor", log_level: Logging.Level = Logging.LEVEL.INFO):
     self.pin: Pin = pin
     self.adc: ADC = ADC(pin)
     self.signal_highLight: int = signal_highLight
     self.signal_lowLight: int = signal_lowLight
+    if signal_highLight == signal_lowLight:
+      raise ValueError("signal_highLight and signal_lowLight cannot be equal.")
+    self._span: int = signal_highLight - signal_lowLight
+    self._k: int = int(round((Utils.UINT16_MAX << _RESCALE_SHIFT) / self._span))
     self.logger = Logging.Log(log_name, log_level)
     self.logger.debug(f"LightSensor initialized on pin {pin} with high_light={signal_highLight}, low_light={signal_lowLight}")
 
@@ -23,7 +57,7 @@ class LightSensor: # TODO: samplingTimes: int = 10, interval_ms: int = 10
     return self.adc.read_u16()
 
   def light_u16(self) -> int:
-    return int(Utils.mapping(self.adc.read_u16(), self.signal_lowLight, self.signal_highLight, 0, Utils.UINT16_MAX))
+    return _rescale_u16(self.adc.read_u16(), self.signal_lowLight, self._span, self._k)
 
 
 class PhotoResistor(LightSensor):
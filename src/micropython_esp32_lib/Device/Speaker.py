@@ -4,7 +4,6 @@
 # file: ./Device/Speaker.py
 """
 
-import utime
 import machine
 
 try: 
@@ -17,8 +16,8 @@ except ImportError:
   import micropython_esp32_lib.Utils.Utils as Utils
 
 class Temperament:
-  def __init__(self, freq: float):
-    self.freq = freq
+  def __init__(self, freq: float | int):
+    self.freq: int = int(round(freq)) # PWM only takes whole hertz, so round once here rather than per note
 class TEMPERAMENT:
   QUIET = Temperament(0.0)
 
@@ -27,65 +26,82 @@ class Equal(Temperament):
   A4_REF_FREQ = 440.0
   @classmethod
   def calculate_frequency(cls, ref_freq: float, n: int) -> float:
+    # The A4 = 440 Hz notes of the table are looked up; `pow` is only paid for other references or ranges.
+    if ref_freq == cls.A4_REF_FREQ and _FREQ_TABLE_LOW <= n < _FREQ_TABLE_LOW + len(_FREQ_TABLE):
+      return _FREQ_TABLE[n - _FREQ_TABLE_LOW]
     return ref_freq * pow(cls.RATIO, n)
+  @classmethod
+  def semitone(cls, n: int) -> "Equal":
+    """Returns the A4-referenced note `n` semitones from A4, taken from `_FREQ_TABLE`."""
+    return cls(_FREQ_TABLE[n - _FREQ_TABLE_LOW])
+
+# Whole-hertz equal-temperament frequencies (A4 = 440 Hz) for n = -21 (C3) to 14 (B5) semitones from A4,
+# i.e. round(440 * 2**(n/12)), written out so importing does no float exponentiation.
+_FREQ_TABLE_LOW = -21
+_FREQ_TABLE: tuple = (
+  131, 139, 147, 156, 165, 175, 185, 196, 208, 220, 233, 247, # C3 .. B3
+  262, 277, 294, 311, 330, 349, 370, 392, 415, 440, 466, 494, # C4 .. B4
+  523, 554, 587, 622, 659, 698, 740, 784, 831, 880, 932, 988, # C5 .. B5
+)
+
 class EQUAL:
   # ... (Omitted for brevity, content remains the same)
   # --- C3 OCTAVE (n = -21 to -10) ---
-  C3 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -21)) # ~= 130.81 Hz
-  CS3 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -20))# ~= 138.59 Hz
+  C3 = Equal.semitone(-21) # ~= 130.81 Hz
+  CS3 = Equal.semitone(-20) # ~= 138.59 Hz
   DB3 = CS3
-  D3 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -19)) # ~= 146.83 Hz
-  DS3 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -18))# ~= 155.56 Hz
+  D3 = Equal.semitone(-19) # ~= 146.83 Hz
+  DS3 = Equal.semitone(-18) # ~= 155.56 Hz
   EB3 = DS3
-  E3 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -17)) # ~= 164.81 Hz
-  F3 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -16)) # ~= 174.61 Hz
-  FS3 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -15))# ~= 184.99 Hz
+  E3 = Equal.semitone(-17) # ~= 164.81 Hz
+  F3 = Equal.semitone(-16) # ~= 174.61 Hz
+  FS3 = Equal.semitone(-15) # ~= 184.99 Hz
   GB3 = FS3
-  G3 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -14)) # ~= 196.00 Hz
-  GS3 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -13))# ~= 207.65 Hz
+  G3 = Equal.semitone(-14) # ~= 196.00 Hz
+  GS3 = Equal.semitone(-13) # ~= 207.65 Hz
   AB3 = GS3
-  A3 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -12)) # ~= 220.00 Hz
-  AS3 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -11))# ~= 233.08 Hz
+  A3 = Equal.semitone(-12) # ~= 220.00 Hz
+  AS3 = Equal.semitone(-11) # ~= 233.08 Hz
   BB3 = AS3
-  B3 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -10)) # ~= 246.94 Hz
+  B3 = Equal.semitone(-10) # ~= 246.94 Hz
 
   # --- C4 OCTAVE (n = -9 to 2) ---
-  C4 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -9))  # ~= 261.63 Hz
-  CS4 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -8)) # ~= 277.18 Hz
+  C4 = Equal.semitone(-9)  # ~= 261.63 Hz
+  CS4 = Equal.semitone(-8) # ~= 277.18 Hz
   DB4 = CS4
-  D4 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -7))  # ~= 293.66 Hz
-  DS4 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -6)) # ~= 311.13 Hz
+  D4 = Equal.semitone(-7)  # ~= 293.66 Hz
+  DS4 = Equal.semitone(-6) # ~= 311.13 Hz
   EB4 = DS4
-  E4 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -5))  # ~= 329.63 Hz
-  F4 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -4))  # ~= 349.23 Hz
-  FS4 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -3)) # ~= 369.99 Hz
+  E4 = Equal.semitone(-5)  # ~= 329.63 Hz
+  F4 = Equal.semitone(-4)  # ~= 349.23 Hz
+  FS4 = Equal.semitone(-3) # ~= 369.99 Hz
   GB4 = FS4
-  G4 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -2))  # ~= 392.00 Hz
-  GS4 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, -1)) # ~= 415.30 Hz
+  G4 = Equal.semitone(-2)  # ~= 392.00 Hz
+  GS4 = Equal.semitone(-1) # ~= 415.30 Hz
   AB4 = GS4
-  A4 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 0))   #  = 440.00 Hz
-  AS4 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 1))  # ~= 466.16 Hz
+  A4 = Equal.semitone(0)   #  = 440.00 Hz
+  AS4 = Equal.semitone(1)  # ~= 466.16 Hz
   BB4 = AS4
-  B4 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 2))   # ~= 493.88 Hz
+  B4 = Equal.semitone(2)   # ~= 493.88 Hz
   
   # --- C5 OCTAVE (n = 3 to 14) ---
-  C5 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 3))   # ~= 523.25 Hz
-  CS5 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 4))  # ~= 554.37 Hz
+  C5 = Equal.semitone(3)   # ~= 523.25 Hz
+  CS5 = Equal.semitone(4)  # ~= 554.37 Hz
   DB5 = CS5
-  D5 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 5))   # ~= 587.33 Hz
-  DS5 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 6))  # ~= 622.25 Hz
+  D5 = Equal.semitone(5)   # ~= 587.33 Hz
+  DS5 = Equal.semitone(6)  # ~= 622.25 Hz
   EB5 = DS5
-  E5 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 7))   # ~= 659.26 Hz
-  F5 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 8))   # ~= 698.46 Hz
-  FS5 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 9))  # ~= 739.99 Hz
+  E5 = Equal.semitone(7)   # ~= 659.26 Hz
+  F5 = Equal.semitone(8)   # ~= 698.46 Hz
+  FS5 = Equal.semitone(9)  # ~= 739.99 Hz
   GB5 = FS5
-  G5 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 10))  # ~= 783.99 Hz
-  GS5 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 11)) # ~= 830.61 Hz
+  G5 = Equal.semitone(10)  # ~= 783.99 Hz
+  GS5 = Equal.semitone(11) # ~= 830.61 Hz
   AB5 = GS5
-  A5 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 12))  # ~= 880.00 Hz
-  AS5 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 13)) # ~= 932.33 Hz
+  A5 = Equal.semitone(12)  # ~= 880.00 Hz
+  AS5 = Equal.semitone(13) # ~= 932.33 Hz
   BB5 = AS5
-  B5 = Equal(Equal.calculate_frequency(Equal.A4_REF_FREQ, 14))  # ~= 987.77 Hz
+  B5 = Equal.semitone(14)  # ~= 987.77 Hz
 
 # class Twelve(Enum.Unit):
 #   ...
@@ -99,6 +115,7 @@ class NoteEvent:
     if amplitude < 0.0: amplitude = 0.0
     elif amplitude > 1.0: amplitude = 1.0
     self.amplitude = amplitude
+    self.duty_u16: int = int(Utils.UINT16_MAX * amplitude) # precomputed so `Speaker.set` does no float math per note
     self.duration_ms = duration_ms
 
 class Speaker:
@@ -109,8 +126,8 @@ class Speaker:
 
   def set(self, noteEvent: NoteEvent) -> None:
     if noteEvent.pitch.freq > 0:
-      self.main.freq(int(noteEvent.pitch.freq))
-      self.main.duty_u16(int(Utils.UINT16_MAX * noteEvent.amplitude))
+      self.main.freq(noteEvent.pitch.freq)
+      self.main.duty_u16(noteEvent.duty_u16)
     else:
       # For quiet notes, just set duty to 0, don't change frequency
       self.main.duty_u16(0)
@@ -56,6 +56,7 @@ class VEDirectConnector:
       Exception: If UART initialization fails.
     """
     self.logger: Logging.Log = Logging.Log(log_name, log_level)
+    self._dbg: bool = self.logger.isEnabledFor(Logging.LEVEL.DEBUG)
     self.active: bool = False
     self._read_task: asyncio.Task | None = None
     
@@ -96,7 +97,7 @@ class VEDirectConnector:
   def _frame_end_event(self, valid: bool) -> None:
     """Called when the Checksum line is received and the frame is complete."""
     if valid:
-        self.logger.debug(f"Frame Validated. Updating public data. ({len(self._temp_frame_data)} fields)")
+        if self._dbg: self.logger.debug(f"Frame Validated. Updating public data. ({len(self._temp_frame_data)} fields)")
         # Use .update() for a quick, near-atomic transfer of the frame data
         self.data.update(self._temp_frame_data)
     else:
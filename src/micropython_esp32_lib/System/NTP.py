@@ -1,45 +1,160 @@
 # System/NTP.py
-import ntptime
+import machine
+import struct
+import usocket
+import utime
+try:
+  import uselect
+except ImportError:
+  uselect = None
+
+import urandom
 
 try: 
+  from ..System import Sleep
   from ..Utils import Logging
 except ImportError:
+  from micropython_esp32_lib.System import Sleep
   from micropython_esp32_lib.Utils import Logging
 
-def syncTimeWithNTP(ntp_host: str = "time.google.com", log_level: Logging.Level = Logging.LEVEL.INFO) -> bool:
+_INFO: Logging.Level = Logging.LEVEL.INFO # bound once; the sync paths test it on every call
+
+_loggers: dict = {} # Logging.Level.value -> "Sync NTP" logger, so repeated syncs reuse one logger per level
+
+def _getLogger(log_level: Logging.Level) -> Logging.Log:
+  logger = _loggers.get(log_level.value)
+  if logger is None:
+    logger = _loggers[log_level.value] = Logging.Log("Sync NTP", log_level)
+  return logger
+
+# Seconds between the NTP epoch (1900) and the port's time epoch (2000 on older ports, 1970 on newer ones).
+_NTP_DELTA: int = 3155673600 if utime.gmtime(0)[0] == 2000 else 2208988800
+# Client request: LI = 0, VN = 3, Mode = 3 in the first byte, every other field zero. Never changes, so it is built once.
+_NTP_REQ: bytes = b"\x1b" + b"\x00" * 47
+
+_DNS_TTL_MS: int = 300_000
+_dns_cache: dict = {} # host -> (sockaddr, ticks_ms expiry)
+
+def _resolve(ntp_host: str):
+  """Returns the UDP/123 socket address of `ntp_host`, reusing a lookup younger than `_DNS_TTL_MS`."""
+  entry = _dns_cache.get(ntp_host)
+  now = utime.ticks_ms()
+  if entry is not None and utime.ticks_diff(entry[1], now) > 0:
+    return entry[0]
+  addr = usocket.getaddrinfo(ntp_host, 123)[0][-1]
+  _dns_cache[ntp_host] = (addr, utime.ticks_add(now, _DNS_TTL_MS))
+  return addr
+
+def _queryNTP(ntp_host: str, timeout_ms: int) -> int:
+  """Asks `ntp_host` for the time with one UDP request, waiting at most `timeout_ms` for the reply.
+
+  Returns:
+    int: Seconds since the port's epoch (UTC).
+  """
+  addr = _resolve(ntp_host)
+  s = usocket.socket(usocket.AF_INET, usocket.SOCK_DGRAM)
+  try:
+    s.settimeout(timeout_ms / 1000)
+    s.sendto(_NTP_REQ, addr)
+    msg = s.recv(48)
+  finally:
+    s.close()
+  return struct.unpack("!I", msg[40:44])[0] - _NTP_DELTA
+
+def _raceNTP(ntp_hosts: list[str], timeout_ms: int) -> int | None:
+  """Sends one request to every host from a single socket and takes the first reply (NTP "iburst" style).
+
+  Returns:
+    int | None: Seconds since the port's epoch (UTC), or None if no server answered within `timeout_ms`.
+  """
+  s = usocket.socket(usocket.AF_INET, usocket.SOCK_DGRAM)
+  try:
+    s.setblocking(False)
+    sent = 0
+    for ntp_host in ntp_hosts:
+      try:
+        s.sendto(_NTP_REQ, _resolve(ntp_host))
+        sent += 1
+      except OSError:
+        pass # unresolvable or unreachable host: the others may still answer
+    if not sent: return None
+    poller = uselect.poll() # type: ignore
+    poller.register(s, uselect.POLLIN) # type: ignore
+    deadline = utime.ticks_add(utime.ticks_ms(), timeout_ms)
+    while True:
+      remaining = utime.ticks_diff(deadline, utime.ticks_ms())
+      if remaining <= 0 or not poller.poll(remaining): return None
+      msg = s.recv(48)
+      if len(msg) == 48 and msg[0] & 0x07 == 4: # a server-mode reply
+        return struct.unpack("!I", msg[40:44])[0] - _NTP_DELTA
+  finally:
+    s.close()
+
+def _setRTC(t: int) -> None:
+  tm = utime.gmtime(t)
+  machine.RTC().datetime((tm[0], tm[1], tm[2], tm[6] + 1, tm[3], tm[4], tm[5], 0))
+
+def syncTimeWithNTP(ntp_host: str = "time.google.com", log_level: Logging.Level = Logging.LEVEL.INFO, timeout_ms: int = 1000) -> bool:
   """  Synchronizes the system time using NTP.
 
   Args:
     ntp_host (str, optional): The NTP server address. Defaults to "time.google.com".
     log_level (Logging.Level, optional): The log level for reporting status. Defaults to Logging.LEVEL.INFO.
+    timeout_ms (int, optional): How long to wait for the server's reply. Defaults to 1000 ms.
 
   Returns:
     bool: True if synchronization was successful, False otherwise.
   """
-  logger = Logging.Log("Sync NTP", log_level)
+  logger = _getLogger(log_level)
 
   try:
-    logger.info(f"System time synchronization in progress (use NTP server: `{ntp_host}`)...")
-    ntptime.host = ntp_host
-    ntptime.settime() 
+    if logger.isEnabledFor(_INFO): # skip formatting the message when it would be dropped
+      logger.info(f"System time synchronization in progress (use NTP server: `{ntp_host}`)...")
+    _setRTC(_queryNTP(ntp_host, timeout_ms))
     logger.info("Synchronization Done.")
     return True
   except Exception as e:
     logger.warning(f"Synchronization Failed. Error: {e}")
     return False
 
-def syncTimeWithNTPs(ntp_hosts: list[str] = ["time.cloudflare.com", "time.google.com", "pool.ntp.org"], log_level: Logging.Level = Logging.LEVEL.INFO) -> bool:
+def _syncOnce(ntp_hosts: list[str], log_level: Logging.Level, timeout_ms: int) -> bool:
+  if uselect is not None:
+    logger = _getLogger(log_level)
+    try:
+      if logger.isEnabledFor(_INFO): # skip formatting the message when it would be dropped
+        logger.info(f"System time synchronization in progress (racing NTP servers: {ntp_hosts})...")
+      t = _raceNTP(ntp_hosts, timeout_ms)
+      if t is not None:
+        _setRTC(t)
+        logger.info("Synchronization Done.")
+        return True
+      logger.warning("Synchronization Failed. No NTP server replied.")
+    except Exception as e:
+      logger.warning(f"Synchronization Failed. Error: {e}")
+    return False
+  for ntp_host in ntp_hosts:
+    if syncTimeWithNTP(ntp_host=ntp_host, log_level=log_level, timeout_ms=timeout_ms):
+      return True
+  return False
+
+def syncTimeWithNTPs(ntp_hosts: list[str] = ["time.cloudflare.com", "time.google.com", "pool.ntp.org"], log_level: Logging.Level = Logging.LEVEL.INFO, timeout_ms: int = 500, 
+                     attempts: int = 1, delay_ms: int = 250) -> bool:
   """Tries to synchronize the system time using multiple NTP servers.
 
   Args:
     ntp_hosts (list[str], optional): A list of NTP server addresses. Defaults to ["time.cloudflare.com", "time.google.com", "pool.ntp.org"].
     log_level (Logging.Level, optional): The log level for reporting status. Defaults to Logging.LEVEL.INFO.
+    timeout_ms (int, optional): How long to wait for the first reply; where `uselect` is missing the servers are tried in turn, each for this long. Defaults to 500 ms.
+    attempts (int, optional): How many rounds to try before giving up. Defaults to 1.
+    delay_ms (int, optional): The wait before the second round; it doubles each round (capped at 2 s) plus up to 63 ms of random jitter. Defaults to 250 ms.
 
   Returns:
     bool: True if synchronization was successful with any server, False otherwise.
   """
-  for ntp_host in ntp_hosts:
-    if syncTimeWithNTP(ntp_host=ntp_host, log_level=log_level):
+  for attempt in range(attempts):
+    if attempt:
+      Sleep.sync_ms(min(delay_ms << (attempt - 1), 2000) + urandom.getrandbits(6))
+    if _syncOnce(ntp_hosts, log_level, timeout_ms):
       return True
   return False
 
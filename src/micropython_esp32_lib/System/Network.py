@@ -8,6 +8,52 @@ except ImportError:
   from micropython_esp32_lib.Utils import Logging
   from micropython_esp32_lib.Utils import Enum
 
+try:
+  import micropython
+except ImportError:
+  micropython = None
+
+if micropython is not None:
+  @micropython.viper
+  def _parse_ipv4(s: ptr8, ln: int, out: ptr8) -> int: # type: ignore
+    # Parses dotted-quad text into the 4 bytes of `out`; returns 1 on success, 0 on malformed input or an octet above 255.
+    octet = 0
+    digits = 0
+    n = 0
+    i = 0
+    while i < ln:
+      c = s[i]
+      if c == 46: # '.'
+        if digits == 0 or n == 3: return 0
+        out[n] = octet
+        n += 1
+        octet = 0
+        digits = 0
+      elif 48 <= c and c <= 57: # '0'..'9'
+        octet = octet * 10 + (c - 48)
+        digits += 1
+        if digits > 3 or octet > 255: return 0
+      else:
+        return 0
+      i += 1
+    if digits == 0 or n != 3: return 0
+    out[3] = octet
+    return 1
+else:
+  def _parse_ipv4(s, ln: int, out) -> int:
+    parts = s.split(".")
+    if len(parts) != 4: return 0
+    for n in range(4):
+      part = parts[n]
+      if not (1 <= len(part) <= 3 and part.isdigit()): return 0
+      octet = int(part)
+      if octet > 255: return 0
+      out[n] = octet
+    return 1
+
+# Ports whose socket module has inet_pton parse dotted quads in C; the others use `_parse_ipv4`.
+_inet_pton = getattr(usocket, "inet_pton", None)
+
 class IPV4Address:
   NONE = (-1, -1, -1, -1)
   def __init__(self, addr: tuple[int, int, int, int] | str | None = None, log_level: Logging.Level = Logging.LEVEL.WARNING) -> None:
@@ -15,49 +61,63 @@ class IPV4Address:
     Initializes an instance of the IPV4Address class.
 
     Args:
-      ip (tuple[int, int, int, int] | None): The IPv4 address as a tuple of integers.
-        If None, the address is set to (0, 0, 0, 0).
+      addr (tuple[int, int, int, int] | str | None): The IPv4 address as a tuple of integers or a dotted-quad string.
+        If None, the address is set to `IPV4Address.NONE`.
+      log_level (Logging.Level, optional): The log level. Defaults to Logging.LEVEL.WARNING.
 
     Raises:
-      ValueError: If the length of the input tuple is not 4,
-        or if any of 
+      ValueError: If the string is malformed, the tuple does not have 4 octets, or an octet is outside 0-255.
+      TypeError: If `addr` is not a tuple, a string, or None.
 
     """
-    logger = Logging.Log("IPV4 Address Constructor", log_level)
-    # Parse addr into a tuple and store it in _addr
-    _addr = tuple()
-    if addr is None: # if addr is None
-      _addr = IPV4Address.NONE
-      logger.debug("No address provided. Set to default {IPV4Address.NONE}.")
-    elif isinstance(addr, str): # if addr is str
-      try:
-        logger.debug(f"Parse address as string {addr}...")
-        _addr = tuple(map(int, addr.split("."))) # type: ignore
-      except ValueError:
-        logger.error(f"Failed to parse address string: {addr}")
+    # Dispatch on the input type directly; only malformed input reaches an exception.
+    # The logger is only built on the error branches, so valid and None addresses construct without one.
+    # The address is held as its 4 bytes in network order (a 32-bit int would be a heap bignum on ESP32 from 64.0.0.0 up); None stands for `IPV4Address.NONE`.
+    if addr is None:
+      self._packed: bytes | None = None
+      self._str: str = "None"
+      return
+    if isinstance(addr, str):
+      if _inet_pton is not None:
+        try: octets = _inet_pton(usocket.AF_INET, addr)
+        except (OSError, ValueError): octets = None
+      else:
+        octets = bytearray(4)
+        if not _parse_ipv4(addr, len(addr), octets): octets = None
+      if octets is None or len(octets) != 4:
+        Logging.Log("IPV4 Address Constructor", log_level).error(f"Failed to parse address string: {addr}")
         raise ValueError(f"Invalid IP address string: {addr}")
-    elif isinstance(addr, tuple): # if addr is tuple
-      logger.debug(f"Clone addr to self")
-      _addr = addr
-    # Validate the _addr format
-    if isinstance(_addr, tuple): # if addr is tuple
-      logger.debug(f"Parse address as tuple {_addr}...")
-      if len(_addr) != 4: # check length
-        logger.error("IPV4 address must have exactly 4 octets")
+      packed = bytes(octets) # already range-checked by the parser
+      a, b, c, d = packed
+    else:
+      if not isinstance(addr, tuple):
+        raise TypeError("Address must be a tuple of 4 integers, a string, or None")
+      if len(addr) != 4: # check length
+        Logging.Log("IPV4 Address Constructor", log_level).error("IPV4 address must have exactly 4 octets")
         raise ValueError("IPV4 address must have exactly 4 octets")
-      if all(0 <= a <= 255 for a in _addr): # check range
-        logger.debug(f"Address set to {_addr}")
-        self.addr: tuple[int, int, int, int] = _addr
-        return
-      else:
-        logger.error("Each number must be between 0 and 255")
+      a, b, c, d = addr
+      if (a | b | c | d) & ~0xFF: # check range; a negative octet also sets high bits
+        Logging.Log("IPV4 Address Constructor", log_level).error("Each number must be between 0 and 255")
         raise ValueError("Each number must be between 0 and 255")
-    raise TypeError("Address must be a tuple of 4 integers, a string, or None")
+      packed = bytes(addr)
+    self._packed = packed
+    self._str = "%d.%d.%d.%d" % (a, b, c, d) # the address never changes, so format it once
+  @property
+  def addr(self) -> tuple[int, int, int, int]:
+    p = self._packed
+    if p is None: return IPV4Address.NONE
+    return (p[0], p[1], p[2], p[3])
+  @property
+  def packed(self) -> bytes | None:
+    """The address as 4 bytes in network order (as `inet_pton` returns it), or None for `IPV4Address.NONE`."""
+    return self._packed
+  def __eq__(self, other) -> bool:
+    if isinstance(other, IPV4Address): return self._packed == other._packed
+    return False
+  def __hash__(self) -> int:
+    return hash(self._packed)
   def __str__(self) -> str:
-    if all(0 <= a <= 255 for a in self.addr): # check range
-      return ".".join(map(str, self.addr))
-    else:
-      return "None"    
+    return self._str
   def __repr__(self) -> str:
     return f"IPV4Address({self.addr})"
   def str(self) -> str:
@@ -46,8 +46,8 @@ def sync_wait_until(condition, timeout_ms: float = -1, interval_ms: int = 1) ->
       sync_ms(interval_ms)
     return True # Condition is met
   else:
-    end_ms = Time.current_ms() + timeout_ms
-    while not bool(condition()) and Time.current_ms() < end_ms:
+    deadline_ms = utime.ticks_add(utime.ticks_ms(), int(timeout_ms))
+    while not bool(condition()) and utime.ticks_diff(deadline_ms, utime.ticks_ms()) > 0:
       sync_ms(interval_ms)
   return bool(condition())
 async def async_wait_until(condition, timeout_ms: float = -1, interval_ms: int = 1) -> bool:
@@ -66,8 +66,8 @@ async def async_wait_until(condition, timeout_ms: float = -1, interval_ms: int =
       await async_ms(interval_ms)
     return True # Condition is met
   else:
-    end_ms = Time.current_ms() + timeout_ms
-    while not bool(condition()) and Time.current_ms() < end_ms:
+    deadline_ms = utime.ticks_add(utime.ticks_ms(), int(timeout_ms))
+    while not bool(condition()) and utime.ticks_diff(deadline_ms, utime.ticks_ms()) > 0:
       await async_ms(interval_ms)
   return bool(condition())
 
@@ -5,6 +5,7 @@ import machine
 import random
 import asyncio
 import inspect
+import utime
 
 try:
   from ..System import Sleep
@@ -130,10 +131,11 @@ class MachineTimer:
       self.logger.error(f"Failed to deinitialize Timer {self._timer_id}: {e}")
       raise e
   def __del__(self):
-    self.deinit()
+    # Finalizers run inside GC: release the hardware and the ID only, no logging.
+    if self._timer_obj is not None:
+      self._timer_obj.deinit()
     # self._timer_obj = None # Timer object is managed by machine module.
     MachineTimer.idManager.free(self._timer_id) # Free the ID
-    self.logger.debug(f"Timer {self._timer_id} deleted.")
   
   def __str__(self):
     return f"Timer({self._timer_id})"
@@ -231,15 +233,80 @@ class MachineTimer:
 #   asyncio.run(main())
 #   logger.info("Async Timer Test Completed.")
 
+try: _wait_for_ms = asyncio.wait_for_ms # type: ignore
+except AttributeError: _wait_for_ms = lambda aw, timeout_ms: asyncio.wait_for(aw, timeout_ms/1000.0)
+
+class TimerScheduler:
+  """Runs the deadline callbacks of any number of timers from a single asyncio task.
+
+  Entries are kept sorted by `ticks_ms` deadline (ordered with `ticks_diff`, so wraparound is safe).
+  Cancelled entries are dropped lazily when they reach the front.
+  """
+  logger = Logging.Log("TimerScheduler", Logging.LEVEL.WARNING)
+  _queue: list = []
+  _wake: asyncio.Event | None = None
+  _task: asyncio.Task | None = None
+
+  @classmethod
+  def schedule(cls, delay_ms: int, callback) -> list:
+    """Schedules `callback()` to run once after `delay_ms`.
+
+    Args:
+      delay_ms (int): The delay in milliseconds.
+      callback (callable): A synchronous callable taking no arguments.
+
+    Returns:
+      list: The queue entry, to pass to `cancel`.
+    """
+    deadline = utime.ticks_add(utime.ticks_ms(), delay_ms)
+    entry = [deadline, callback]
+    queue, ticks_diff = cls._queue, utime.ticks_diff
+    i = len(queue)
+    while i > 0 and ticks_diff(queue[i-1][0], deadline) > 0:
+      i -= 1
+    queue.insert(i, entry)
+    if cls._task is None:
+      cls._wake = asyncio.Event()
+      cls._task = asyncio.create_task(cls._run())
+    elif i == 0:
+      cls._wake.set() # type: ignore
+    return entry
+  @classmethod
+  def cancel(cls, entry: list) -> None:
+    entry[1] = None
+  @classmethod
+  async def _run(cls) -> None:
+    queue, wake = cls._queue, cls._wake
+    ticks_ms, ticks_diff = utime.ticks_ms, utime.ticks_diff
+    try:
+      while queue:
+        deadline, callback = queue[0]
+        if callback is None:
+          queue.pop(0)
+          continue
+        delta = ticks_diff(deadline, ticks_ms())
+        if delta > 0:
+          wake.clear() # type: ignore
+          try: await _wait_for_ms(wake.wait(), delta) # type: ignore
+          except asyncio.TimeoutError: pass
+          continue
+        queue.pop(0)
+        try: callback()
+        except Exception as e: cls.logger.error(f"Timer callback failed: {e}")
+    finally:
+      cls._task = None
+
 class AsyncTimer:
   def __init__(self, interval_ms: int, 
                callback, callback_isAsync: bool = False, callback_args: tuple = (), callback_kwargs: dict = {}, 
                repeat: bool = False, 
               #  start: bool = True, 
                log_name: str = "AsyncTimer", log_level: Logging.Level = Logging.LEVEL.INFO):
+    """Software timer; all instances share the single `TimerScheduler` task instead of owning one each."""
     self.logger = Logging.Log(f"{log_name}", log_level)
     self.active = False
-    self._timer_task: asyncio.Task | None = None
+    self._entry: list | None = None
+    self._generation: int = 0
     self.interval_ms = interval_ms
     self.callback = callback
     self.callback_isAsync = callback_isAsync
@@ -248,51 +315,50 @@ class AsyncTimer:
     self.repeat = repeat
     self.logger.debug(f"Created successfully.")
     # if start: self.start()
-  async def _run_timer(self):
-    # self.active = True
-    # self.logger.debug(f"Async timer started with interval {self.interval_ms}ms. Repeat: {self.repeat}")
-    while self.active:
-      await Sleep.async_ms(self.interval_ms)
-      # self.logger.debug(f"Async timer executing callback after {self.interval_ms}ms.")
-      # callback_result = self.callback(*self.callback_args, **self.callback_kwargs)
-      # self.logger.debug(f"Async timer Sync callback execution completed.")
-      # if inspect.iscoroutinefunction(callback_result):
-      #   self.logger.debug(f"detected async callback, awaiting result.")
-      #   await callback_result
-      # # else:
-      # #   self.callback(*self.callback_args, **self.callback_kwargs)
-      if self.callback_isAsync:
-        await self.callback(*self.callback_args, **self.callback_kwargs)
-        self.logger.debug(f"Async timer Async callback execution completed.")
-      else:
-        self.callback(*self.callback_args, **self.callback_kwargs)
-        self.logger.debug(f"Async timer Sync callback execution completed.")
-      if not self.repeat:
-        break
-    self.active = False
-    self.logger.debug(f"Async timer stopped.")
+  def _fire(self) -> None:
+    if not self.active: return
+    if self.callback_isAsync:
+      asyncio.create_task(self._fire_async(self._generation))
+      return
+    self._entry = None
+    self.callback(*self.callback_args, **self.callback_kwargs)
+    self.logger.debug(f"Async timer Sync callback execution completed.")
+    self._rearm()
+  async def _fire_async(self, generation: int) -> None:
+    await self.callback(*self.callback_args, **self.callback_kwargs)
+    self.logger.debug(f"Async timer Async callback execution completed.")
+    if generation == self._generation:
+      self._entry = None
+      self._rearm()
+  def _rearm(self) -> None:
+    if self.repeat and self.active:
+      self._entry = TimerScheduler.schedule(self.interval_ms, self._fire)
+    else:
+      self.active = False
+      self.logger.debug(f"Async timer stopped.")
   def isActivate(self) -> bool:
     return self.active
   async def activate(self):
     self.logger.debug(f"Async timer task activate.")
     if not self.active:
       self.active = True
-    if self._timer_task is None or self._timer_task.done():
-      self._timer_task = asyncio.create_task(self._run_timer())
+    if self._entry is None:
+      self._entry = TimerScheduler.schedule(self.interval_ms, self._fire)
   def deactivate(self):
     if self.active:
       self.active = False
-    if self._timer_task is not None: 
-      self._timer_task.cancel()
-    self._timer_task = None
+    if self._entry is not None: 
+      TimerScheduler.cancel(self._entry)
+    self._entry = None
+    self._generation += 1
     self.logger.debug(f"Async timer task deactivate.")
   async def reactivate(self):
     if self.active:
       self.deactivate()
     await self.activate()
-  def __del__(self): # TODO: fix: may not work
-    self.deactivate()
-    self.logger.debug(f"Async timer deleted.")
+  def __del__(self):
+    # Finalizers run inside GC: only flag the timer as stopped; call `deactivate()` explicitly to cancel it.
+    self.active = False
 
 # if __name__ == '__main__':
 #   async def callback1():
@@ -1,5 +1,12 @@
 # System/WiFi.py
 import network
+try:
+  import micropython
+except ImportError:
+  micropython = None
+
+# Emits machine code for small hot lookups on MicroPython; a no-op elsewhere
+_native = micropython.native if micropython is not None else (lambda f: f)
 
 try: 
   from ..Utils import Logging
@@ -13,7 +20,8 @@ except ImportError:
   from micropython_esp32_lib.System import Network
 
 class Statu(Enum.Unit):
-  """WLAN connection status constants (network.STAT_*)"""
+  """WLAN connection status constants (network.STAT_*); hashable by value, so instances can key dicts and sets"""
+  __slots__ = () # only `name` and `value`, held in the slots of Enum.Unit
   def __init__(self, name: str, code: int) -> None:
     super().__init__(name, code)
   def __repr__(self) -> str:
@@ -21,39 +29,64 @@ class Statu(Enum.Unit):
   def __eq__(self, other) -> bool:
     if isinstance(other, Statu): return self.value == other.value
     return False
+  __hash__ = Enum.Unit.__hash__ # defining __eq__ drops the inherited hash
 class STATU:
   """WLAN connection status constants (network.STAT_*)"""
-  # Define fallback values in case MicroPython's network module lacks them
-  IDLE            : Statu = Statu("IDLE"           ,1000) # network.STAT_IDLE: no connection and no activity
-  CONNECTING      : Statu = Statu("CONNECTING"     ,1001) # network.STAT_CONNECTING: connecting in progress
-  GOT_IP          : Statu = Statu("GOT_IP"         ,1010) # network.STAT_GOT_IP: connection successful
-  NO_AP_FOUND     : Statu = Statu("NO_AP_FOUND"    ,201 ) # network.STAT_NO_AP_FOUND: failed because no access point replied
-  WRONG_PASSWORD  : Statu = Statu("WRONG_PASSWORD" ,202 ) # network.STAT_WRONG_PASSWORD: failed due to incorrect password
-  CONNECT_FAIL    : Statu = Statu("CONNECT_FAIL"   ,203 ) # network.STAT_CONNECT_FAIL: failed due to other problems
-  try:
-    IDLE            : Statu = Statu("IDLE"           ,network.STAT_IDLE          ) # type: ignore # network.STAT_IDLE: no connection and no activity
-    CONNECTING      : Statu = Statu("CONNECTING"     ,network.STAT_CONNECTING    ) # type: ignore # network.STAT_CONNECTING: connecting in progress
-    GOT_IP          : Statu = Statu("GOT_IP"         ,network.STAT_GOT_IP        ) # type: ignore # network.STAT_GOT_IP: connection successful
-    NO_AP_FOUND     : Statu = Statu("NO_AP_FOUND"    ,network.STAT_NO_AP_FOUND   ) # type: ignore # network.STAT_NO_AP_FOUND: failed because no access point replied
-    WRONG_PASSWORD  : Statu = Statu("WRONG_PASSWORD" ,network.STAT_WRONG_PASSWORD) # type: ignore # network.STAT_WRONG_PASSWORD: failed due to incorrect password
-    CONNECT_FAIL    : Statu = Statu("CONNECT_FAIL"   ,network.STAT_CONNECT_FAIL  ) # type: ignore # network.STAT_CONNECT_FAIL: failed due to other problems
-  except AttributeError:
-    tmp=Logging.Log("Network Constants Status", Logging.LEVEL.WARNING)
-    tmp.warning("Network status constants (`network.STAT_*`) not fully found. Using internal fallbacks.")
-    del tmp
+  # Each constant is built once from network.STAT_*, falling back to the listed code where the port lacks it
+  IDLE            : Statu = Statu("IDLE"           ,getattr(network, "STAT_IDLE"          , 1000)) # network.STAT_IDLE: no connection and no activity
+  CONNECTING      : Statu = Statu("CONNECTING"     ,getattr(network, "STAT_CONNECTING"    , 1001)) # network.STAT_CONNECTING: connecting in progress
+  GOT_IP          : Statu = Statu("GOT_IP"         ,getattr(network, "STAT_GOT_IP"        , 1010)) # network.STAT_GOT_IP: connection successful
+  NO_AP_FOUND     : Statu = Statu("NO_AP_FOUND"    ,getattr(network, "STAT_NO_AP_FOUND"   , 201 )) # network.STAT_NO_AP_FOUND: failed because no access point replied
+  WRONG_PASSWORD  : Statu = Statu("WRONG_PASSWORD" ,getattr(network, "STAT_WRONG_PASSWORD", 202 )) # network.STAT_WRONG_PASSWORD: failed due to incorrect password
+  CONNECT_FAIL    : Statu = Statu("CONNECT_FAIL"   ,getattr(network, "STAT_CONNECT_FAIL"  , 203 )) # network.STAT_CONNECT_FAIL: failed due to other problems
+  if not all(hasattr(network, n) for n in ("STAT_IDLE", "STAT_CONNECTING", "STAT_GOT_IP", "STAT_NO_AP_FOUND", "STAT_WRONG_PASSWORD", "STAT_CONNECT_FAIL")):
+    Logging.Log("Network Constants Status", Logging.LEVEL.WARNING).warning("Network status constants (`network.STAT_*`) not fully found. Using internal fallbacks.")
+
+  _by_code: dict = {
+    IDLE.value           : IDLE          ,
+    CONNECTING.value     : CONNECTING    ,
+    GOT_IP.value         : GOT_IP        ,
+    NO_AP_FOUND.value    : NO_AP_FOUND   ,
+    WRONG_PASSWORD.value : WRONG_PASSWORD,
+    CONNECT_FAIL.value   : CONNECT_FAIL  ,
+  }
+  _by_name: dict = {
+    IDLE.name           : IDLE          ,
+    CONNECTING.name     : CONNECTING    ,
+    GOT_IP.name         : GOT_IP        ,
+    NO_AP_FOUND.name    : NO_AP_FOUND   ,
+    WRONG_PASSWORD.name : WRONG_PASSWORD,
+    CONNECT_FAIL.name   : CONNECT_FAIL  ,
+  }
 
   @classmethod
+  @_native
   def query(cls, code: int) -> Statu:
-    if code == cls.IDLE           .value : return cls.IDLE           
-    if code == cls.CONNECTING     .value : return cls.CONNECTING     
-    if code == cls.GOT_IP         .value : return cls.GOT_IP         
-    if code == cls.NO_AP_FOUND    .value : return cls.NO_AP_FOUND    
-    if code == cls.WRONG_PASSWORD .value : return cls.WRONG_PASSWORD 
-    if code == cls.CONNECT_FAIL   .value : return cls.CONNECT_FAIL   
-    return Statu("UNKNOWN", code)
+    statu = cls._by_code.get(code)
+    return statu if statu is not None else Statu("UNKNOWN", code)
+  @classmethod
+  def by_name(cls, name: str) -> Statu | None:
+    """Returns the status constant called `name` (e.g. "GOT_IP"), or None if there is none."""
+    return cls._by_name.get(name)
+
+# Raw status codes polled by the connectors, bound once so connect() skips the STATU.X.value chains
+_ST_CONNECTING: int = STATU.CONNECTING.value
+_ST_IDLE      : int = STATU.IDLE.value
+_ST_GOT_IP    : int = STATU.GOT_IP.value
+# Final status code -> reason logged when a connection attempt fails
+_FAIL_MSGS: dict = {
+  STATU.IDLE.value           : "idle status"   ,
+  STATU.WRONG_PASSWORD.value : "wrong password",
+  STATU.NO_AP_FOUND.value    : "no AP found"   ,
+  STATU.CONNECT_FAIL.value   : "connect fail"  ,
+}
+def _log_fail(logger: Logging.Log, final_status: int) -> None:
+  """Logs why a connection attempt ended in the raw status code `final_status`; shared by both connectors."""
+  logger.warning("WiFi connection failed: " + _FAIL_MSGS.get(final_status, "unknown status"))
 
 class PowerManagement(Enum.Unit):
-  """WLAN power management modes (network.PM_*)"""
+  """WLAN power management modes (network.PM_*); hashable by value, so instances can key dicts and sets"""
+  __slots__ = () # only `name` and `value`, held in the slots of Enum.Unit
   def __init__(self, name: str, id: int):
     super().__init__(name, id)
   def __repr__(self) -> str:
@@ -61,28 +94,22 @@ class PowerManagement(Enum.Unit):
   def __eq__(self, other) -> bool:
     if isinstance(other, PowerManagement): return self.value == other.value
     return False
+  __hash__ = Enum.Unit.__hash__ # defining __eq__ drops the inherited hash
+if hasattr(network, "MODE_PERFORMANCE") and hasattr(network, "MODE_NONE"):
+  _PM_CODES = (network.MODE_PERFORMANCE, network.MODE_NONE) # type: ignore
+elif hasattr(network, "WLAN") and hasattr(network.WLAN, "PM_ACTIVE") and hasattr(network.WLAN, "PM_POWERSAVE"):
+  _PM_CODES = (network.WLAN.PM_ACTIVE, network.WLAN.PM_POWERSAVE) # type: ignore # Common esp32/esp8266 power modes
+else:
+  _PM_CODES = (0, 1) # MicroPython PM modes (often 0, 1, 2)
+  Logging.Log("Network Constants Power Management", Logging.LEVEL.WARNING).warning("Network power management constants (`network.PM_*`) not fully found. Using internal fallbacks.")
 class PM:
   """WLAN power management modes (network.PM_*)"""
-  # MicroPython PM modes (often 0, 1, 2)
-  ACTIVE    : PowerManagement = PowerManagement("ACTIVE"    ,0)
-  POWERSAVE : PowerManagement = PowerManagement("POWERSAVE" ,1)
-  
-  try:
-    # Attempt to map MicroPython's specific constants if available
-    ACTIVE    : PowerManagement = PowerManagement("ACTIVE"    ,network.MODE_PERFORMANCE) # type: ignore
-    POWERSAVE : PowerManagement = PowerManagement("POWERSAVE" ,network.MODE_NONE       ) # type: ignore
-  except AttributeError:
-    try:
-      # Common esp32/esp8266 power modes
-      ACTIVE    : PowerManagement = PowerManagement("ACTIVE"    ,network.WLAN.PM_ACTIVE   ) # type: ignore
-      POWERSAVE : PowerManagement = PowerManagement("POWERSAVE" ,network.WLAN.PM_POWERSAVE) # type: ignore
-    except AttributeError:
-      tmp=Logging.Log("Network Constants Power Management", Logging.LEVEL.WARNING)
-      tmp.warning("Network power management constants (`network.PM_*`) not fully found. Using internal fallbacks.")
-      del tmp
+  ACTIVE    : PowerManagement = PowerManagement("ACTIVE"    ,_PM_CODES[0])
+  POWERSAVE : PowerManagement = PowerManagement("POWERSAVE" ,_PM_CODES[1])
 
 class Mode(Enum.Unit):
-  """WLAN operating modes (network.MODE_*)"""
+  """WLAN operating modes (network.MODE_*); hashable by value, so instances can key dicts and sets"""
+  __slots__ = () # only `name` and `value`, held in the slots of Enum.Unit
   def __init__(self, name: str, id: int):
     super().__init__(name, id)
   def __repr__(self) -> str:
@@ -90,20 +117,33 @@ class Mode(Enum.Unit):
   def __eq__(self, other) -> bool:
     if isinstance(other, Mode): return self.value == other.value
     return False
+  __hash__ = Enum.Unit.__hash__ # defining __eq__ drops the inherited hash
 class MODE:
   """WLAN operating modes (network.MODE_*)"""
-  STA : Mode = Mode("STA", 1) # Station mode (client)
-  AP  : Mode = Mode("AP" , 2) # Access Point mode
-  try:
-    STA : Mode = Mode("STA", network.STA_IF) # type: ignore # Station mode (client)
-    AP  : Mode = Mode("AP" , network.AP_IF ) # type: ignore # Access Point mode
-  except AttributeError:
-    tmp=Logging.Log("Network Constants Mode", Logging.LEVEL.WARNING)
-    tmp.warning("Network interface constants (`network.STA_IF`, `network.AP_IF`) not fully found. Using internal fallbacks (1, 2).")
-    del tmp
+  STA : Mode = Mode("STA", getattr(network, "STA_IF", 1)) # Station mode (client)
+  AP  : Mode = Mode("AP" , getattr(network, "AP_IF" , 2)) # Access Point mode
+  if not (hasattr(network, "STA_IF") and hasattr(network, "AP_IF")):
+    Logging.Log("Network Constants Mode", Logging.LEVEL.WARNING).warning("Network interface constants (`network.STA_IF`, `network.AP_IF`) not fully found. Using internal fallbacks (1, 2).")
+
+# (Config attribute, to_dict() key, converter or None) for the ifconfig parameters (used for static IP configuration)
+_IFCFG: tuple = (("hostAddress", "ip", str), ("subnet", "subnet", str), ("gateway", "gateway", str), ("dns", "dns", str))
+# ... and for the wlan.config() parameters
+_WCFG: tuple = (("hostname", "hostname", None), ("mac", "mac", None), ("channel", "channel", None), ("reconnects", "reconnects", None),
+                ("security", "security", None), ("hidden", "hidden", None), ("key", "key", None), ("txpower", "txpower", None), ("pm", "pm", None))
+_CFG_FIELDS: tuple = _IFCFG + _WCFG
+# Keys of Config.to_dict() that are applied through wlan.config()
+_CFG_KEYS: tuple = tuple(key for _, key, _ in _WCFG)
+
+# Whether bytes.hex() takes a separator on this port, so MAC strings are built in C
+try:
+  _HEX_SEP: bool = b"\x00\x00".hex(":") == "00:00"
+except (AttributeError, TypeError):
+  _HEX_SEP = False
 
 class Config:
   """Configuration container for WLAN connection and settings."""
+  __slots__ = ("ssid", "password", "hostAddress", "subnet", "gateway", "dns", "hostname", "mac", "channel",
+               "reconnects", "security", "hidden", "key", "txpower", "pm", "logger") # no per-instance __dict__; typos in attribute names raise
   def __init__( self, 
                 ssid: str | None = None, 
                 password: str | None = None, 
@@ -161,45 +201,19 @@ class Config:
     return f"WiFi.Config({self.ssid}, {self.password})"
   def to_dict(self) -> dict:
     """Converts configuration attributes to a dictionary for wlan.config() calls.
-    This function first tries to convert the ifconfig parameters (hostAddress, subnet, gateway, dns) to a dictionary, and then tries to convert the wlan.config() parameters (hostname, mac, channel, reconnects, security, hidden, key, txpower, pm) to the same dictionary.
+    Walks the ifconfig parameters (hostAddress, subnet, gateway, dns; stored as strings) and then the wlan.config() parameters (hostname, mac, channel, reconnects, security, hidden, key, txpower, pm), skipping any that are None.
     If any Exception occurs during the conversion, it is caught, logged as an error, and then re-raised.
     Returns:
       dict: A dictionary containing the configuration attributes.
     """
     config = {}
-    try: # ifconfig parameters (used for static IP configuration)
-      if self.hostAddress is not None:
-        config['ip'] = self.hostAddress.__str__()
-      if self.subnet is not None:
-        config['subnet'] = self.subnet.__str__()
-      if self.gateway is not None:
-        config['gateway'] = self.gateway.__str__()
-      if self.dns is not None:
-        config['dns'] = self.dns.__str__()
-    except Exception as e:
-      self.logger.error(e.__str__())
-      raise e
-    try: # wlan.config() parameters
-      if self.hostname is not None:
-        config['hostname'] = self.hostname
-      if self.mac is not None:
-        config['mac'] = self.mac
-      if self.channel is not None:
-        config['channel'] = self.channel
-      if self.reconnects is not None:
-        config['reconnects'] = self.reconnects
-      if self.security is not None:
-        config['security'] = self.security
-      if self.hidden is not None:
-        config['hidden'] = self.hidden
-      if self.key is not None:
-        config['key'] = self.key
-      if self.txpower is not None:
-        config['txpower'] = self.txpower
-      if self.pm is not None:
-        config['pm'] = self.pm
+    try:
+      for attr, key, conv in _CFG_FIELDS:
+        value = getattr(self, attr)
+        if value is not None:
+          config[key] = value if conv is None else conv(value)
     except Exception as e:
-      self.logger.error(e.__str__())
+      self.logger.error(str(e))
       raise e
     return config
 class Connector:
@@ -218,8 +232,11 @@ class Connector:
     self.connecting_timeout_ms: int = connecting_timeout_ms
     self.idle_timeout_ms: int = idle_timeout_ms
     self.logger: Logging.Log = Logging.Log(name=log_name, level=log_level)
+    self._info_on: bool = self.logger.isEnabledFor(Logging.LEVEL.INFO) # gates INFO messages that cost formatting or interface reads to build
     self.wlan = network.WLAN(interface.value)
     self.config: Config | None = None
+    self._applied: tuple | None = None # (Config, its field values) last pushed by _config_(); cleared by deactivate()
+    self._hostname_key: str | None = None # "dhcp_hostname" or "hostname", whichever wlan.config() accepts; set by getHostname()
 
   def _config_(self, config) -> None:
     """Applies wlan.config() settings and static IP settings (if applicable).
@@ -232,29 +249,36 @@ class Connector:
       If 'ip' is not present, the static IP configuration will not be changed.
       If 'hostname', 'mac', 'channel', 'reconnects', 'security', 'hidden', 'key', 'txpower', or 'pm' are present in config, they will be applied.
       If any of the above parameters are not present in config, their values will not be changed.
+      Re-applying the same Config object with unchanged fields is skipped, until the interface is deactivated.
     """
     _config: Config = config
     self.config = _config
+    fields = tuple(getattr(_config, attr) for attr, _, _ in _CFG_FIELDS)
+    applied = self._applied
+    if applied is not None and applied[0] is _config and applied[1] == fields:
+      return # already pushed to the interface: skip the dict rebuild and the native calls
     config_dict = self.config.to_dict()
     
     # Apply static IP configuration if provided
     if 'ip' in config_dict:
       ip_config_tuple = (config_dict['ip'], config_dict.get('subnet', '255.255.255.0'), config_dict.get('gateway', '0.0.0.0'), config_dict.get('dns', '8.8.8.8'))
-      self.logger.info(f"Setting static IP config: {ip_config_tuple}")
+      if self._info_on: self.logger.info(f"Setting static IP config: {ip_config_tuple}")
       self.wlan.ifconfig(tuple(ip_config_tuple))
             
-    # Apply general configuration parameters
-    config_params = {
-      'hostname': None, 'mac': None, 'channel': None, 'reconnects': None, 
-      'security': None, 'hidden': None, 'key': None, 'txpower': None, 'pm': None
-    }
-    for key in config_params.keys():
-      if key in config_dict:
-        try:
-          self.wlan.config(**{key: config_dict[key]})
-        except (ValueError, TypeError) as e:
-          # Log non-critical errors for unsupported config keys
-          self.logger.warning(f"Warning: Could not set config param '{key}'. Error: {e}")
+    # Apply general configuration parameters in one wlan.config() call
+    kwargs = {k: config_dict[k] for k in _CFG_KEYS if k in config_dict}
+    if kwargs:
+      try:
+        self.wlan.config(**kwargs)
+      except (ValueError, TypeError):
+        # One unsupported key rejects the whole batch: retry each key so the rest still apply
+        for key, value in kwargs.items():
+          try:
+            self.wlan.config(**{key: value})
+          except (ValueError, TypeError) as e:
+            # Log non-critical errors for unsupported config keys
+            self.logger.warning(f"Warning: Could not set config param '{key}'. Error: {e}")
+    self._applied = (_config, fields)
   def getConfig(self, configName: str):
     return self.wlan.config(configName)
   def getSSID(self) -> str:
@@ -272,17 +296,176 @@ class Connector:
   def getMAC_Bytes(self) -> bytes:
     return self.wlan.config("mac")
   def getMAC_Str(self) -> str:
-    return ":".join([f"{b:02X}" for b in self.getMAC_Bytes()])
+    mac = self.getMAC_Bytes()
+    if _HEX_SEP: return mac.hex(":").upper()
+    return ":".join(["%02X" % b for b in mac])
   def getHostname(self) -> str:
-    try: 
-      return self.wlan.config("dhcp_hostname")
-    except:
-      return self.wlan.config("hostname")
+    key = self._hostname_key
+    if key is None: # probe once which name this port uses, then reuse it
+      try:
+        value = self.wlan.config("dhcp_hostname")
+        self._hostname_key = "dhcp_hostname"
+        return value
+      except:
+        key = self._hostname_key = "hostname"
+    return self.wlan.config(key)
   def isConnected(self) -> bool:
     return self.wlan.isconnected()
 
+  # The activation, connection and disconnection sequences below are shared by SyncConnector and AsyncConnector.
+  # Each is a generator that yields `(condition, timeout_ms, interval_ms)` wherever it has to wait, is sent the
+  # wait's result back, and returns the outcome; `_run_sync`/`_run_async` drive it with the matching Sleep helper.
+  def _activate_steps(self, timeout_ms: int, retry_count: int, retry_interval_ms: int | None):
+    if retry_interval_ms is None: retry_interval_ms = self.interval_ms
+    wlan, log = self.wlan, self.logger
+    if not wlan.active():
+      log.info("Activing... ")
+      wlan.active(True)
+      is_active = wlan.active # zero-arg call returns the state: usable as the predicate as is
+      for i in range(retry_count):
+        if (yield is_active, timeout_ms, retry_interval_ms):
+          ok = True # the wait already read the state: no need to ask the interface again
+          break
+        log.info("Activing... ")
+      else:
+        ok = is_active() # retries exhausted (or none allowed): take one last reading
+      if ok:
+        log.info("Activated.")
+        return True
+      else:
+        log.warning("Failed to activate.")
+        return False
+    else:
+      log.info("WiFi is already actived.")
+      return True
+  def _deactivate_steps(self, timeout_ms: int, retry_count: int, retry_interval_ms: int | None):
+    if retry_interval_ms is None: retry_interval_ms = self.interval_ms
+    wlan, log = self.wlan, self.logger
+    if wlan.active():
+      log.info("Deactiving... ")
+      wlan.active(False)
+      self._applied = None # a powered-down interface may come back without the applied settings
+      is_active = wlan.active
+      def not_active() -> bool: return not is_active() # built once, not per retry
+      for i in range(retry_count):
+        if (yield not_active, timeout_ms, retry_interval_ms):
+          ok = True # the wait already read the state: no need to ask the interface again
+          break
+        log.info("Deactiving... ")
+      else:
+        ok = not_active() # retries exhausted (or none allowed): take one last reading
+      if ok:
+        log.info("Deactivated.")
+        return True
+      else:
+        log.warning("Failed to deactivate.")
+        return False
+    else:
+      log.info("WiFi is already deactivated.")
+      return True
+  def _connect_steps(self, config: Config, timeout_ms: int, retry_count: int, retry_interval_ms: int | None):
+    if retry_interval_ms is None: retry_interval_ms = self.interval_ms
+    wlan, log = self.wlan, self.logger
+    _config: Config = config
+    if _config.ssid is None: # checked before any activation, disconnect or config I/O
+      log.warning("Connection aborted: SSID not provided.")
+      return False
+    if not wlan.active():
+      log.info("WiFi is not actived. Activating now.")
+      if not (yield from self._activate_steps(timeout_ms, retry_count, retry_interval_ms)):
+        log.warning("Connection aborted: WiFi failed to activate.")
+        return False
+    if wlan.isconnected():
+      log.info("WiFi already connected. Reconnecting now.")
+      if not (yield from self._disconnect_steps(timeout_ms, retry_count, retry_interval_ms)):
+        log.warning("Connection aborted: WiFi failed to disconnect.")
+        return False
+    # Apply configuration (like hostname, power mode, static IP)
+    self._config_(_config)
+    # Start the connection process
+    if self._info_on: log.info(f"Attempting to connect to SSID: {_config.ssid}")
+    wlan.connect(_config.ssid, _config.password if _config.password is not None else "")
+    # Wait for the connection process to complete; the predicates compare raw status codes, so no Statu is built per tick
+    status = wlan.status
+    connecting, idle = _ST_CONNECTING, _ST_IDLE
+    if status() == connecting:
+      log.info("Wifi connecting...")
+      if not (yield lambda: status() != connecting, timeout_ms, self.interval_ms):
+        log.warning("Wifi connection timeout.")
+        return False
+      log.info("Wifi connected.")
+    if status() == idle:
+      log.info("Wifi idle...")
+      if not (yield lambda: status() != idle, timeout_ms, self.interval_ms):
+        log.warning("Wifi idle timeout.")
+        return False
+      log.info("Wifi idle.")
+    # Check the final connection status
+    final_status = status()
+    if final_status == _ST_GOT_IP:
+      if self._info_on: log.info(f"WiFi connected successfully. HostName: {self.getHostname()}, IP: {(self.getHostIP())}, MAC: {self.getMAC_Str()}")
+      return True
+    _log_fail(log, final_status)
+    yield from self._disconnect_steps(timeout_ms, retry_count, retry_interval_ms)
+    yield from self._deactivate_steps(timeout_ms, retry_count, retry_interval_ms)
+    return False
+  def _tryConnect_steps(self, configs: list[Config], timeout_ms: int, retry_count: int, retry_interval_ms: int | None):
+    for config in configs:
+      if config.ssid is None: continue # nothing to join: skip it without touching the interface
+      if (yield from self._connect_steps(config, timeout_ms, retry_count, retry_interval_ms)):
+        return True
+    return False
+  def _disconnect_steps(self, timeout_ms: int, retry_count: int, retry_interval_ms: int | None):
+    if retry_interval_ms is None: retry_interval_ms = self.interval_ms
+    wlan, log = self.wlan, self.logger
+    if wlan.isconnected():
+      wlan.disconnect()
+      # Wait for disconnect
+      isconnected, status, idle = wlan.isconnected, wlan.status, _ST_IDLE
+      def disconnected() -> bool: return not isconnected() and status() == idle # built once, not per retry
+      for i in range(retry_count):
+        if self._info_on: log.info(f"Wifi disconnecting... ({i+1}/{retry_count})")
+        if (yield disconnected, timeout_ms, self.interval_ms):
+          log.info("Wifi disconnected.")
+          return True
+        else:
+          log.warning("Wifi disconnect timeout.")
+      if not wlan.isconnected():
+        log.info("Wifi disconnected.")
+        return True
+      else:
+        log.warning("Wifi disconnect failed.")
+        return False
+    else:
+      log.info("WiFi is not connected.")
+      return True
+
+def _run_sync(steps):
+  """Runs a connector step generator to completion, blocking on each wait it yields, and returns its result."""
+  wait = Sleep.sync_wait_until
+  try:
+    request = next(steps)
+    while True:
+      condition, timeout_ms, interval_ms = request
+      request = steps.send(wait(condition, timeout_ms=timeout_ms, interval_ms=interval_ms))
+  except StopIteration as e:
+    return e.args[0] if e.args else None
+async def _run_async(steps):
+  """Runs a connector step generator to completion, awaiting each wait it yields, and returns its result."""
+  wait = Sleep.async_wait_until
+  try:
+    request = next(steps)
+    while True:
+      condition, timeout_ms, interval_ms = request
+      request = steps.send(await wait(condition, timeout_ms=timeout_ms, interval_ms=interval_ms))
+  except StopIteration as e:
+    return e.args[0] if e.args else None
+
 class SyncConnector(Connector):
-  """Handles Synchronous activation, connection, and configuration of the Wi-Fi interface."""
+  """Handles Synchronous activation, connection, and configuration of the Wi-Fi interface.
+
+  Call `disconnect()` and `deactivate()` explicitly when done; nothing is torn down from a finalizer.
+  """
   def activate(self, timeout_ms: int = -1, retry_count: int = 8, retry_interval_ms: int | None = None) -> bool:
     """Activates the Wi-Fi interface.
     Parameters:
@@ -295,24 +478,7 @@ class SyncConnector(Connector):
       If timeout_ms is -1, the function will not wait for the Wi-Fi interface to become active.
       If retry_interval_ms is None, the function will use the interval_ms attribute of the class instance.
     """
-    if retry_interval_ms is None: retry_interval_ms = self.interval_ms
-    if not self.wlan.active():
-      self.logger.info("Activing... ")
-      self.wlan.active(True)
-      for i in range(retry_count):
-        if Sleep.sync_wait_until(lambda: self.wlan.active(), timeout_ms=timeout_ms, interval_ms=retry_interval_ms):
-          break
-        self.logger.info("Activing... ")
-      if self.wlan.active():
-        self.logger.info("Activated.")
-        return True
-      else:
-        self.logger.warning("Failed to activate.")
-        return False
-    else:
-      self.logger.info("WiFi is already actived.")
-      return True
-    
+    return _run_sync(self._activate_steps(timeout_ms, retry_count, retry_interval_ms))
   def deactivate(self, timeout_ms: int = -1, retry_count: int = 8, retry_interval_ms: int | None = None) -> bool:
     """Deactivates the Wi-Fi interface.
     Parameters:
@@ -325,23 +491,7 @@ class SyncConnector(Connector):
       If timeout_ms is -1, the function will not wait for the Wi-Fi interface to become inactive.
       If retry_interval_ms is None, the function will use the interval_ms attribute of the class instance.
     """
-    if retry_interval_ms is None: retry_interval_ms = self.interval_ms
-    if self.wlan.active():
-      self.logger.info("Deactiving... ")
-      self.wlan.active(False)
-      for i in range(retry_count):
-        if Sleep.sync_wait_until(lambda: not self.wlan.active(), timeout_ms=timeout_ms, interval_ms=retry_interval_ms):
-          break
-        self.logger.info("Deactiving... ")
-      if not self.wlan.active():
-        self.logger.info("Deactivated.")
-        return True
-      else:
-        self.logger.warning("Failed to deactivate.")
-        return False
-    else:
-      self.logger.info("WiFi is already deactivated.")
-      return True
+    return _run_sync(self._deactivate_steps(timeout_ms, retry_count, retry_interval_ms))
   def connect(self, config: Config, timeout_ms: int = -1, retry_count: int = 8, retry_interval_ms: int | None = None) -> bool:
     """Connects to a Wi-Fi network using the provided configuration.
     Parameters:
@@ -355,66 +505,7 @@ class SyncConnector(Connector):
         If timeout_ms is -1, the function will not wait for the Wi-Fi interface to become active.
         If retry_interval_ms is None, the function will use the interval_ms attribute of the class instance.
     """
-    if retry_interval_ms is None: retry_interval_ms = self.interval_ms
-    _config: Config = config
-    if not self.wlan.active():
-      self.logger.info("WiFi is not actived. Activating now.")
-      if not self.activate(timeout_ms=timeout_ms, retry_count=retry_count, retry_interval_ms=retry_interval_ms):
-        self.logger.warning("Connection aborted: WiFi failed to activate.")
-        return False
-    if self.wlan.isconnected():
-      self.logger.info("WiFi already connected. Reconnecting now.")
-      if not self.disconnect(timeout_ms=timeout_ms, retry_count=retry_count, retry_interval_ms=retry_interval_ms):
-        self.logger.warning("Connection aborted: WiFi failed to disconnect.")
-        return False
-    # Apply configuration (like hostname, power mode, static IP)
-    self._config_(_config)
-    # Start the connection process
-    if (_config.ssid is not None):
-      self.logger.info(f"Attempting to connect to SSID: {_config.ssid}")
-      self.wlan.connect(_config.ssid, _config.password if _config.password is not None else "")
-    else:
-      self.logger.warning("Connection aborted: SSID not provided.")
-      return False
-    # Wait for the connection process to complete
-    if STATU.query(self.wlan.status()) == STATU.CONNECTING:
-      for i in range(retry_count):
-        self.logger.info("Wifi connecting... ({}/{})".format(i+1, retry_count))
-        if Sleep.sync_wait_until(lambda: STATU.query(self.wlan.status()) != STATU.CONNECTING, timeout_ms=timeout_ms, interval_ms=self.interval_ms):
-          self.logger.info("Wifi connected.")
-          break
-        else:
-          self.logger.warning("Wifi connection timeout.")
-          return False
-    if STATU.query(self.wlan.status()) == STATU.IDLE:
-      for i in range(retry_count):
-        self.logger.info("Wifi idle... ({}/{})".format(i+1, retry_count))
-        if Sleep.sync_wait_until(lambda: STATU.query(self.wlan.status()) != STATU.IDLE, timeout_ms=timeout_ms, interval_ms=self.interval_ms):
-          self.logger.info("Wifi idle.")
-          break
-        else:
-          self.logger.warning("Wifi idle timeout.")
-          return False
-    # Check the final connection status
-    final_status = STATU.query(self.wlan.status())
-    if final_status == STATU.GOT_IP:
-      # ip_config: tuple[str, str, str, str] = self.wlan.ifconfig()
-      self.logger.info(f"WiFi connected successfully. HostName: {self.getHostname()}, IP: {(self.getHostIP())}, MAC: {self.getMAC_Str()}")
-      return True
-    
-    elif final_status == STATU.IDLE:
-      self.logger.warning("WiFi connection failed: idle status")
-    elif final_status == STATU.WRONG_PASSWORD:
-      self.logger.warning("WiFi connection failed: wrong password")
-    elif final_status == STATU.NO_AP_FOUND:
-      self.logger.warning("WiFi connection failed: no AP found")
-    elif final_status == STATU.CONNECT_FAIL:
-      self.logger.warning("WiFi connection failed: connect fail")
-    else:
-      self.logger.warning("WiFi connection failed: unknown status")
-    self.disconnect(timeout_ms=timeout_ms, retry_count=retry_count, retry_interval_ms=retry_interval_ms)
-    self.deactivate(timeout_ms=timeout_ms, retry_count=retry_count, retry_interval_ms=retry_interval_ms)
-    return False
+    return _run_sync(self._connect_steps(config, timeout_ms, retry_count, retry_interval_ms))
   def tryConnect(self, configs: list[Config], timeout_ms: int = -1, retry_count: int = 8, retry_interval_ms: int | None = None) -> bool:
     """Connects to a Wi-Fi network using the provided list of configurations.
     Parameters:
@@ -428,10 +519,7 @@ class SyncConnector(Connector):
         If timeout_ms is -1, the function will not wait for the Wi-Fi interface to become active.
         If retry_interval_ms is None, the function will use the interval_ms attribute of the class instance.
     """
-    for config in configs:
-      if self.connect(config, timeout_ms=timeout_ms, retry_count=retry_count, retry_interval_ms=retry_interval_ms):
-        return True
-    return False
+    return _run_sync(self._tryConnect_steps(configs, timeout_ms, retry_count, retry_interval_ms))
   def disconnect(self, timeout_ms: int = -1, retry_count: int = 8, retry_interval_ms: int | None = None) -> bool:
     """Disconnects from the current Wi-Fi network.
     Parameters:
@@ -444,33 +532,13 @@ class SyncConnector(Connector):
         If timeout_ms is -1, the function will not wait for the Wi-Fi interface to become disconnected.
         If retry_interval_ms is None, the function will use the interval_ms attribute of the class instance.
     """
-    if retry_interval_ms is None: retry_interval_ms = self.interval_ms
-    if self.wlan.isconnected():
-      self.wlan.disconnect()
-      # Wait for disconnect
-      for i in range(retry_count):
-        self.logger.info("Wifi disconnecting... ({}/{})".format(i+1, retry_count))
-        if Sleep.sync_wait_until(lambda: not self.wlan.isconnected() and Statu("", self.wlan.status()) == STATU.IDLE, timeout_ms=timeout_ms, interval_ms=self.interval_ms):
-          self.logger.info("Wifi disconnected.")
-          return True
-        else:
-          self.logger.warning("Wifi disconnect timeout.")
-      if not self.wlan.isconnected():
-        self.logger.info("Wifi disconnected.")
-        return True
-      else:
-        self.logger.warning("Wifi disconnect failed.")
-        return False
-    else:
-      self.logger.info("WiFi is not connected.")
-      return True
-  def __del__(self):
-    self.disconnect()
-    self.deactivate()
-    self.logger.info("WiFi connection closed.")
+    return _run_sync(self._disconnect_steps(timeout_ms, retry_count, retry_interval_ms))
 
 class AsyncConnector(Connector):
-  """Handles Asynchronous activation, connection, and configuration of the Wi-Fi interface."""
+  """Handles Asynchronous activation, connection, and configuration of the Wi-Fi interface.
+
+  Await `disconnect()` and `deactivate()` explicitly when done; nothing is torn down from a finalizer.
+  """
   async def activate(self, timeout_ms: int = -1, retry_count: int = 8, retry_interval_ms: int | None = None) -> bool:
     """Activates the Wi-Fi interface.
     Parameters:
@@ -483,24 +551,7 @@ class AsyncConnector(Connector):
       If timeout_ms is -1, the function will not wait for the Wi-Fi interface to become active.
       If retry_interval_ms is None, the function will use the interval_ms attribute of the class instance.
     """
-    if retry_interval_ms is None: retry_interval_ms = self.interval_ms
-    if not self.wlan.active():
-      self.logger.info("Activing... ")
-      self.wlan.active(True)
-      for i in range(retry_count):
-        if await Sleep.async_wait_until(lambda: self.wlan.active(), timeout_ms=timeout_ms, interval_ms=retry_interval_ms):
-          break
-        self.logger.info("Activing... ")
-      if self.wlan.active():
-        self.logger.info("Activated.")
-        return True
-      else:
-        self.logger.warning("Failed to activate.")
-        return False
-    else:
-      self.logger.info("WiFi is already actived.")
-      return True
-    
+    return await _run_async(self._activate_steps(timeout_ms, retry_count, retry_interval_ms))
   async def deactivate(self, timeout_ms: int = -1, retry_count: int = 8, retry_interval_ms: int | None = None) -> bool:
     """Deactivates the Wi-Fi interface.
     Parameters:
@@ -513,23 +564,7 @@ class AsyncConnector(Connector):
       If timeout_ms is -1, the function will not wait for the Wi-Fi interface to become inactive.
       If retry_interval_ms is None, the function will use the interval_ms attribute of the class instance.
     """
-    if retry_interval_ms is None: retry_interval_ms = self.interval_ms
-    if self.wlan.active():
-      self.logger.info("Deactiving... ")
-      self.wlan.active(False)
-      for i in range(retry_count):
-        if await Sleep.async_wait_until(lambda: not self.wlan.active(), timeout_ms=timeout_ms, interval_ms=retry_interval_ms):
-          break
-        self.logger.info("Deactiving... ")
-      if not self.wlan.active():
-        self.logger.info("Deactivated.")
-        return True
-      else:
-        self.logger.warning("Failed to deactivate.")
-        return False
-    else:
-      self.logger.info("WiFi is already deactivated.")
-      return True
+    return await _run_async(self._deactivate_steps(timeout_ms, retry_count, retry_interval_ms))
   async def connect(self, config: Config, timeout_ms: int = -1, retry_count: int = 8, retry_interval_ms: int | None = None) -> bool:
     """Connects to a Wi-Fi network using the provided configuration.
     Parameters:
@@ -543,66 +578,7 @@ class AsyncConnector(Connector):
         If timeout_ms is -1, the function will not wait for the Wi-Fi interface to become active.
         If retry_interval_ms is None, the function will use the interval_ms attribute of the class instance.
     """
-    if retry_interval_ms is None: retry_interval_ms = self.interval_ms
-    _config: Config = config
-    if not self.wlan.active():
-      self.logger.info("WiFi is not actived. Activating now.")
-      if not await self.activate(timeout_ms=timeout_ms, retry_count=retry_count, retry_interval_ms=retry_interval_ms):
-        self.logger.warning("Connection aborted: WiFi failed to activate.")
-        return False
-    if self.wlan.isconnected():
-      self.logger.info("WiFi already connected. Reconnecting now.")
-      if not await self.disconnect(timeout_ms=timeout_ms, retry_count=retry_count, retry_interval_ms=retry_interval_ms):
-        self.logger.warning("Connection aborted: WiFi failed to disconnect.")
-        return False
-    # Apply configuration (like hostname, power mode, static IP)
-    self._config_(_config)
-    # Start the connection process
-    if (_config.ssid is not None):
-      self.logger.info(f"Attempting to connect to SSID: {_config.ssid}")
-      self.wlan.connect(_config.ssid, _config.password if _config.password is not None else "")
-    else:
-      self.logger.warning("Connection aborted: SSID not provided.")
-      return False
-    # Wait for the connection process to complete
-    if STATU.query(self.wlan.status()) == STATU.CONNECTING:
-      for i in range(retry_count):
-        self.logger.info("Wifi connecting... ({}/{})".format(i+1, retry_count))
-        if await Sleep.async_wait_until(lambda: STATU.query(self.wlan.status()) != STATU.CONNECTING, timeout_ms=timeout_ms, interval_ms=self.interval_ms):
-          self.logger.info("Wifi connected.")
-          break
-        else:
-          self.logger.warning("Wifi connection timeout.")
-          return False
-    if STATU.query(self.wlan.status()) == STATU.IDLE:
-      for i in range(retry_count):
-        self.logger.info("Wifi idle... ({}/{})".format(i+1, retry_count))
-        if await Sleep.async_wait_until(lambda: STATU.query(self.wlan.status()) != STATU.IDLE, timeout_ms=timeout_ms, interval_ms=self.interval_ms):
-          self.logger.info("Wifi idle.")
-          break
-        else:
-          self.logger.warning("Wifi idle timeout.")
-          return False
-    # Check the final connection status
-    final_status = STATU.query(self.wlan.status())
-    if final_status == STATU.GOT_IP:
-      # ip_config: tuple[str, str, str, str] = self.wlan.ifconfig()
-      self.logger.info(f"WiFi connected successfully. HostName: {self.getHostname()}, IP: {(self.getHostIP())}, MAC: {self.getMAC_Str()}")
-      return True
-    
-    elif final_status == STATU.IDLE:
-      self.logger.warning("WiFi connection failed: idle status")
-    elif final_status == STATU.WRONG_PASSWORD:
-      self.logger.warning("WiFi connection failed: wrong password")
-    elif final_status == STATU.NO_AP_FOUND:
-      self.logger.warning("WiFi connection failed: no AP found")
-    elif final_status == STATU.CONNECT_FAIL:
-      self.logger.warning("WiFi connection failed: connect fail")
-    else:
-      self.logger.warning("WiFi connection failed: unknown status")
-    await self.disconnect(timeout_ms=timeout_ms, retry_count=retry_count, retry_interval_ms=retry_interval_ms)
-    await self.deactivate(timeout_ms=timeout_ms, retry_count=retry_count, retry_interval_ms=retry_interval_ms)
-    return False
+    return await _run_async(self._connect_steps(config, timeout_ms, retry_count, retry_interval_ms))
   async def tryConnect(self, configs: list[Config], timeout_ms: int = -1, retry_count: int = 8, retry_interval_ms: int | None = None) -> bool:
     """Connects to a Wi-Fi network using the provided list of configurations.
     Parameters:
@@ -616,10 +592,7 @@ class AsyncConnector(Connector):
         If timeout_ms is -1, the function will not wait for the Wi-Fi interface to become active.
         If retry_interval_ms is None, the function will use the interval_ms attribute of the class instance.
     """
-    for config in configs:
-      if await self.connect(config, timeout_ms=timeout_ms, retry_count=retry_count, retry_interval_ms=retry_interval_ms):
-        return True
-    return False
+    return await _run_async(self._tryConnect_steps(configs, timeout_ms, retry_count, retry_interval_ms))
   async def disconnect(self, timeout_ms: int = -1, retry_count: int = 8, retry_interval_ms: int | None = None) -> bool:
     """Disconnects from the current Wi-Fi network.
     Parameters:
@@ -632,30 +605,7 @@ class AsyncConnector(Connector):
         If timeout_ms is -1, the function will not wait for the Wi-Fi interface to become disconnected.
         If retry_interval_ms is None, the function will use the interval_ms attribute of the class instance.
     """
-    if retry_interval_ms is None: retry_interval_ms = self.interval_ms
-    if self.wlan.isconnected():
-      self.wlan.disconnect()
-      # Wait for disconnect
-      for i in range(retry_count):
-        self.logger.info("Wifi disconnecting... ({}/{})".format(i+1, retry_count))
-        if await Sleep.async_wait_until(lambda: not self.wlan.isconnected() and Statu("", self.wlan.status()) == STATU.IDLE, timeout_ms=timeout_ms, interval_ms=self.interval_ms):
-          self.logger.info("Wifi disconnected.")
-          return True
-        else:
-          self.logger.warning("Wifi disconnect timeout.")
-      if not self.wlan.isconnected():
-        self.logger.info("Wifi disconnected.")
-        return True
-      else:
-        self.logger.warning("Wifi disconnect failed.")
-        return False
-    else:
-      self.logger.info("WiFi is not connected.")
-      return True
-  async def __del__(self):
-    await self.disconnect()
-    await self.deactivate()
-    self.logger.info("WiFi connection closed.")
+    return await _run_async(self._disconnect_steps(timeout_ms, retry_count, retry_interval_ms))
 
 if __name__ == '__main__':
   logger = Logging.Log("Test Network", Logging.LEVEL.INFO)
@@ -2,6 +2,7 @@
 # file: ./Utils/DigitalFilters.py
 """
 import machine
+import utime
 
 try:
   from ..System import Sleep
@@ -14,6 +15,38 @@ except ImportError:
   from micropython_esp32_lib.Utils import Enum
   from micropython_esp32_lib.Utils import Logging
 
+try:
+  import micropython
+except ImportError:
+  micropython = None
+
+if micropython is not None:
+  @micropython.viper
+  def _countFiltering_kernel(read, sleep, target: int, threshold: int, interval_ms: int) -> int:
+    # Native counter for `countFiltering_sync`; `read` is the bound `pin.value` and `sleep` is `Sleep.sync_ms`.
+    cnt = 0
+    low = 0 - threshold
+    while low < cnt and cnt < threshold:
+      if int(read()) == target:
+        if cnt >= 0: cnt += 1
+        else: cnt = 1
+      else:
+        if cnt <= 0: cnt -= 1
+        else: cnt = -1
+      sleep(interval_ms)
+    if cnt >= threshold: return 1
+    return 0
+  @micropython.viper
+  def _holdStable_kernel(read, sleep, ticks_ms, ticks_diff, deadline, target: int, interval_ms: int) -> int:
+    # Native loop for `holdStable_sync`; returns 0 as soon as the pin leaves `target`.
+    while int(ticks_diff(deadline, ticks_ms())) > 0:
+      if int(read()) != target: return 0
+      sleep(interval_ms)
+    return 1
+else:
+  _countFiltering_kernel = None
+  _holdStable_kernel = None
+
 def isChanged_sync(pin: machine.Pin, start_signal: Digital.Signal, end_signal: Digital.Signal, threshold: int = 10, interval_ms: int = 1) -> bool:
   """Synchronously detects if the pin's value briefly changes from `start_signal` to `end_signal`.  
   
@@ -91,13 +124,16 @@ def countFiltering_sync(pin: machine.Pin, target_signal: Digital.Signal, thresho
   Returns:
     bool: True if the pin is stably at `target_signal`, False otherwise.
   """
+  if _countFiltering_kernel is not None:
+    return _countFiltering_kernel(pin.value, Sleep.sync_ms, target_signal.value, threshold, interval_ms) == 1
+  read, sleep, target = pin.value, Sleep.sync_ms, target_signal.value
   cnt = 0
   while -threshold < cnt < threshold:
-    if pin.value() == target_signal.value:
+    if read() == target:
       cnt = cnt + 1 if cnt >= 0 else 1
     else:
       cnt = cnt - 1 if cnt <= 0 else -1
-    Sleep.sync_ms(interval_ms)
+    sleep(interval_ms)
   return cnt >= threshold
 
 async def countFiltering_async(pin: machine.Pin, target_signal: Digital.Signal, threshold: int, interval_ms: int) -> bool:
@@ -115,13 +151,14 @@ async def countFiltering_async(pin: machine.Pin, target_signal: Digital.Signal,
   Returns:
     bool: True if the pin is stably at `target_signal`, False otherwise.
   """
+  read, sleep, target = pin.value, Sleep.async_ms, target_signal.value
   cnt = 0
   while -threshold < cnt < threshold:
-    if pin.value() == target_signal.value:
+    if read() == target:
       cnt = cnt + 1 if cnt >= 0 else 1
     else:
       cnt = cnt - 1 if cnt <= 0 else -1
-    await Sleep.async_ms(interval_ms)
+    await sleep(interval_ms)
   return cnt >= threshold
 
 def isChangedStably_sync(pin: machine.Pin, start_signal: Digital.Signal, end_signal: Digital.Signal, threshold: int, interval_ms: int) -> bool:
@@ -171,3 +208,107 @@ async def isChangedStably_async(pin: machine.Pin, start_signal: Digital.Signal,
     await Sleep.async_ms(interval_ms)
   
   return await countFiltering_async(pin, end_signal, threshold, interval_ms)
+
+def countClicks_sync(pin: machine.Pin, released_signal: Digital.Signal, threshold: int, interval_ms: int, timeout_ms: int) -> int:
+  """Synchronously counts complete clicks (press then release) within a time window.  
+
+  The pin is read once per `interval_ms` and fed through a single debounce state machine, so each click costs one pass over the samples instead of one filter run per edge.  
+  A level change is accepted after `threshold` consecutive readings, and the count starts from the released state.  
+
+  Args:
+    pin (machine.Pin): The digital pin to monitor.
+    released_signal (Digital.Signal): The signal read while the button is released.
+    threshold (int): The number of consecutive readings required to accept a level change.
+    interval_ms (int): The delay in milliseconds between pin readings.
+    timeout_ms (int): The length of the counting window in milliseconds.
+
+  Returns:
+    int: The number of clicks completed within the window.
+  """
+  read, sleep, released = pin.value, Sleep.sync_ms, released_signal.value
+  ticks_ms, ticks_diff = utime.ticks_ms, utime.ticks_diff
+  deadline = utime.ticks_add(ticks_ms(), timeout_ms)
+  pressed, run, clicks = False, 0, 0
+  while ticks_diff(deadline, ticks_ms()) > 0:
+    if (read() != released) != pressed:
+      run += 1
+      if run >= threshold:
+        pressed, run = not pressed, 0
+        if not pressed: clicks += 1
+    else:
+      run = 0
+    sleep(interval_ms)
+  return clicks
+
+async def countClicks_async(pin: machine.Pin, released_signal: Digital.Signal, threshold: int, interval_ms: int, timeout_ms: int) -> int:
+  """Asynchronously counts complete clicks (press then release) within a time window.  
+
+  The pin is read once per `interval_ms` and fed through a single debounce state machine, so each click costs one pass over the samples instead of one filter run per edge.  
+  A level change is accepted after `threshold` consecutive readings, and the count starts from the released state.  
+
+  Args:
+    pin (machine.Pin): The digital pin to monitor.
+    released_signal (Digital.Signal): The signal read while the button is released.
+    threshold (int): The number of consecutive readings required to accept a level change.
+    interval_ms (int): The delay in milliseconds between pin readings.
+    timeout_ms (int): The length of the counting window in milliseconds.
+
+  Returns:
+    int: The number of clicks completed within the window.
+  """
+  read, sleep, released = pin.value, Sleep.async_ms, released_signal.value
+  ticks_ms, ticks_diff = utime.ticks_ms, utime.ticks_diff
+  deadline = utime.ticks_add(ticks_ms(), timeout_ms)
+  pressed, run, clicks = False, 0, 0
+  while ticks_diff(deadline, ticks_ms()) > 0:
+    if (read() != released) != pressed:
+      run += 1
+      if run >= threshold:
+        pressed, run = not pressed, 0
+        if not pressed: clicks += 1
+    else:
+      run = 0
+    await sleep(interval_ms)
+  return clicks
+
+def holdStable_sync(pin: machine.Pin, target_signal: Digital.Signal, duration_ms: int, interval_ms: int) -> bool:
+  """Synchronously checks that the pin stays at `target_signal` for `duration_ms`, e.g. for a long press.  
+
+  Args:
+    pin (machine.Pin): The digital pin to monitor.
+    target_signal (Digital.Signal): The signal the pin has to hold.
+    duration_ms (int): How long the signal has to be held, in milliseconds.
+    interval_ms (int): The delay in milliseconds between pin readings.
+
+  Returns:
+    bool: True if the pin held `target_signal` for the whole duration, False as soon as it leaves it.
+  """
+  deadline = utime.ticks_add(utime.ticks_ms(), duration_ms)
+  if _holdStable_kernel is not None:
+    return _holdStable_kernel(pin.value, Sleep.sync_ms, utime.ticks_ms, utime.ticks_diff, deadline, target_signal.value, interval_ms) == 1
+  read, sleep, target = pin.value, Sleep.sync_ms, target_signal.value
+  ticks_ms, ticks_diff = utime.ticks_ms, utime.ticks_diff
+  while ticks_diff(deadline, ticks_ms()) > 0:
+    if read() != target: return False
+    sleep(interval_ms)
+  return True
+
+async def holdStable_async(pin: machine.Pin, target_signal: Digital.Signal, duration_ms: int, interval_ms: int) -> bool:
+  """Asynchronously checks that the pin stays at `target_signal` for `duration_ms`, e.g. for a long press.  
+
+  Args:
+    pin (machine.Pin): The digital pin to monitor.
+    target_signal (Digital.Signal): The signal the pin has to hold.
+    duration_ms (int): How long the signal has to be held, in milliseconds.
+    interval_ms (int): The delay in milliseconds between pin readings.
+
+  Returns:
+    bool: True if the pin held `target_signal` for the whole duration, False as soon as it leaves it.
+  """
+  deadline = utime.ticks_add(utime.ticks_ms(), duration_ms)
+  read, sleep, target = pin.value, Sleep.async_ms, target_signal.value
+  ticks_ms, ticks_diff = utime.ticks_ms, utime.ticks_diff
+  while ticks_diff(deadline, ticks_ms()) > 0:
+    if read() != target: return False
+    await sleep(interval_ms)
+  return True
@@ -9,6 +9,7 @@ except ImportError:
   import micropython_esp32_lib.Utils.Utils as Utils
 
 class Unit(abc.ABC):
+  __slots__ = ("name", "value")
   def __init__(self, name: str, value: int):
     """
     Initialize a Code object with a name and code.
@@ -33,4 +34,7 @@ class Unit(abc.ABC):
       return self.value == other.value
     return False  
   def __ne__(self, other) -> bool:
-    return not self.__eq__(other)
\ No newline at end of file
+    return not self.__eq__(other)
+  def __hash__(self) -> int:
+    # Hashes by value so units can key dicts and sets; subclasses that define `__eq__` must rebind `__hash__ = Enum.Unit.__hash__`
+    return hash(self.value)
\ No newline at end of file
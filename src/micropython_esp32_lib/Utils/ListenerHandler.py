@@ -85,6 +85,15 @@ class ListenerHandler(abc.ABC):
     self.active = False
   def __del__(self) -> None:
     self.deactivate()
+async def activateAll(handlers) -> None:
+  """Activates several ListenerHandlers by awaiting each one's own `activate()`, in order.
+
+  Args:
+    handlers (iterable[ListenerHandler]): The handlers to activate.
+  """
+  for handler in handlers:
+    await handler.activate()
+
 class SyncListenerHandler(ListenerHandler):
   def __init__(self, listener: SyncListener, period_ms: int = 100, log_name: str = "SyncListenerHandler", log_level: Logging.Level = Logging.LEVEL.INFO, *args, **kwargs):
     """
@@ -135,10 +144,11 @@ class SyncListenerSyncHandler(SyncListenerHandler):
     super().__init__(listener, period_ms, log_name, log_level, *args, **kwargs)
     self.handler: SyncHandler = handler
   async def listen(self):
+    listen, handle, sleep, period_ms = self.listener.listen, self.handler.handle, Sleep.async_ms, self.period_ms
     while self.active:
-      if self.listener.listen():
-        thread.start_new_thread(self.handler.handle, (self.listener.obj,))
-      await Sleep.async_ms(self.period_ms)
+      if listen():
+        thread.start_new_thread(handle, (self.listener.obj,))
+      await sleep(period_ms)
 class SyncListenerAsyncHandler(SyncListenerHandler):
   """Listener Handler Class"""
   def __init__(self, listener: SyncListener, handler: AsyncHandler, period_ms: int = 100, log_name: str = "SyncListenerAsyncHandler", log_level: Logging.Level = Logging.LEVEL.INFO, *args, **kwargs):
@@ -157,10 +167,11 @@ class SyncListenerAsyncHandler(SyncListenerHandler):
     super().__init__(listener, period_ms, log_name, log_level, *args, **kwargs)
     self.handler: AsyncHandler = handler
   async def listen(self):
+    listen, handle, sleep, period_ms = self.listener.listen, self.handler.handle, Sleep.async_ms, self.period_ms
     while self.active:
-      if self.listener.listen():
-        asyncio.create_task(self.handler.handle(self.listener.obj))
-      await Sleep.async_ms(self.period_ms)
+      if listen():
+        asyncio.create_task(handle(self.listener.obj))
+      await sleep(period_ms)
 class AsyncListenerSyncHandler(AsyncListenerHandler):
   """Listener Handler Class"""
   def __init__(self, listener: AsyncListener, handler: SyncHandler, period_ms: int = 100, log_name: str = "AsyncListenerSyncHandler", log_level: Logging.Level = Logging.LEVEL.INFO, *args, **kwargs):
@@ -179,10 +190,11 @@ class AsyncListenerSyncHandler(AsyncListenerHandler):
     super().__init__(listener, period_ms, log_name, log_level, *args, **kwargs)
     self.handler: SyncHandler = handler
   async def listen(self):
+    listen, handle, sleep, period_ms = self.listener.listen, self.handler.handle, Sleep.async_ms, self.period_ms
     while self.active:
-      if await self.listener.listen():
-        thread.start_new_thread(self.handler.handle, (self.listener.obj,))
-      await Sleep.async_ms(self.period_ms)
+      if await listen():
+        thread.start_new_thread(handle, (self.listener.obj,))
+      await sleep(period_ms)
 class AsyncListenerAsyncHandler(AsyncListenerHandler):
   """Listener Handler Class"""
   def __init__(self, listener: AsyncListener, handler: AsyncHandler, period_ms: int = 100, log_name: str = "AsyncListenerAsyncHandler", log_level: Logging.Level = Logging.LEVEL.INFO, *args, **kwargs):
@@ -201,7 +213,8 @@ class AsyncListenerAsyncHandler(AsyncListenerHandler):
     super().__init__(listener, period_ms, log_name, log_level, *args, **kwargs)
     self.handler: AsyncHandler = handler
   async def listen(self):
+    listen, handle, sleep, period_ms = self.listener.listen, self.handler.handle, Sleep.async_ms, self.period_ms
     while self.active:
-      if await self.listener.listen():
-        asyncio.create_task(self.handler.handle(self.listener.obj))
-      await Sleep.async_ms(self.period_ms)
+      if await listen():
+        asyncio.create_task(handle(self.listener.obj))
+      await sleep(period_ms)
@@ -1,5 +1,5 @@
 """
-# file: ./System/Logging.py
+# file: ./Utils/Logging.py
 """
 try: 
   from ..System import Time
@@ -163,6 +163,10 @@ class Log:
     self.name = name
     self.level = level    
 
+  def isEnabledFor(self, level: Level) -> bool:
+    """Returns True if a message of `level` would be emitted, so callers can skip building it otherwise."""
+    return not level.lower(self.level)
+
   def _log(self, level: Level, message: str) -> None:
     if level.lower(self.level):
       return